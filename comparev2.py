@@ -10,18 +10,33 @@ Version: 2.0 - Dynamic Fallback Edition
 
 import sys
 import os
+import io
+import shutil
+import subprocess
 import requests
 import requests.exceptions
 import json
 import time
 import uuid
-import pathlib
-import webbrowser
+import re
+import math
+import secrets
+import tempfile
+import threading
 from typing import Dict, List, Optional, Tuple, Any
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from requests_toolbelt import MultipartEncoder
 import importlib
+import importlib.util
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from itertools import count, islice
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+import heapq
 
 # Global variables for dynamic imports
 vs = None
@@ -32,12 +47,15 @@ PIL_Image = None
 PIL_ImageDraw = None
 PIL_ImageFont = None
 np = None
+pyspng = None
 
 # Library availability flags
 VAPOURSYNTH_AVAILABLE = False
+AWSMFUNC_AVAILABLE = False
 OPENCV_AVAILABLE = False
 PIL_AVAILABLE = False
 NUMPY_AVAILABLE = False
+PYSPNG_AVAILABLE = False
 
 # Color codes for terminal styling
 class Colors:
@@ -52,10 +70,55 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# Style prefixes for every (color, bold) pair, built once instead of on each print
+_STYLES = {}
+for _color in (Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.BLUE, Colors.MAGENTA, Colors.CYAN, Colors.WHITE):
+    _STYLES[(_color, False)] = _color
+    _STYLES[(_color, True)] = Colors.BOLD + _color
+del _color
+
+def _style_prefix(color, bold):
+    """Look up the escape prefix for a color, building it for colors outside the table"""
+    style = _STYLES.get((color, bold))
+    if style is None:
+        style = Colors.BOLD + color if bold else color
+    return style
+
+# Escape codes only mean something on a terminal; redirected output (pipes, log files) is written
+# plain, which also skips building the styled strings. Decided once so _batched_output keeps colors.
+# This only picks the style - writers still check for a missing stdout themselves (see colored_print).
+_isatty = getattr(sys.stdout, 'isatty', None)
+COLOR_OUTPUT = bool(_isatty and _isatty()) and 'NO_COLOR' not in os.environ
+del _isatty
+
+def colorize(text, color=Colors.WHITE, bold=False):
+    """Wrap text in terminal color codes"""
+    if not COLOR_OUTPUT:
+        return str(text)
+    return _style_prefix(color, bold) + str(text) + Colors.END
+
 def colored_print(text, color=Colors.WHITE, bold=False, end='\n'):
     """Print colored text to terminal"""
-    style = f"{Colors.BOLD if bold else ''}{color}"
-    print(f"{style}{text}{Colors.END}", end=end)
+    out = sys.stdout
+    if out is None:  # Windowed builds (pythonw, PyInstaller console=False) have no stdout
+        return
+    if COLOR_OUTPUT:
+        out.write(_style_prefix(color, bold) + str(text) + Colors.END + end)
+    else:
+        out.write(f"{text}{end}")
+
+@contextmanager
+def _batched_output():
+    """Collect everything printed inside the block and write it to stdout in a single call"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        out = sys.stdout
+        if out is not None:
+            out.write(buffer.getvalue())
+            out.flush()
 
 def print_header(text):
     """Print a styled header"""
@@ -65,7 +128,7 @@ def print_header(text):
 
 def try_import_vapoursynth():
     """Try to import VapourSynth and related libraries"""
-    global vs, awf, core, VAPOURSYNTH_AVAILABLE
+    global vs, core, VAPOURSYNTH_AVAILABLE, AWSMFUNC_AVAILABLE
     try:
         import vapoursynth as vs_module
         vs = vs_module
@@ -73,23 +136,41 @@ def try_import_vapoursynth():
         VAPOURSYNTH_AVAILABLE = True
         colored_print("[OK] VapourSynth detected and imported successfully", Colors.GREEN)
         
-        # Try to import awsmfunc
-        try:
-            import awsmfunc as awf_module
-            awf = awf_module
-            colored_print("[OK] awsmfunc detected and imported successfully", Colors.GREEN)
-        except ImportError:
+        # awsmfunc pulls in a large dependency tree at import time but is only used for auto-crop,
+        # so only check that it is installed here and import it on first use (see get_awsmfunc)
+        AWSMFUNC_AVAILABLE = importlib.util.find_spec("awsmfunc") is not None
+        if AWSMFUNC_AVAILABLE:
+            colored_print("[OK] awsmfunc detected (imported on first use)", Colors.GREEN)
+        else:
             colored_print("[WARN] awsmfunc not available (optional for advanced features)", Colors.YELLOW)
-            awf = None
             
         return True
     except ImportError as e:
         colored_print(f"[ERROR] VapourSynth not available: {e}", Colors.RED)
         return False
 
-def try_import_opencv():
-    """Try to import OpenCV"""
+def get_awsmfunc():
+    """Import awsmfunc the first time it is needed; returns None when it is unavailable"""
+    global awf, AWSMFUNC_AVAILABLE
+    if awf is None and AWSMFUNC_AVAILABLE:
+        try:
+            import awsmfunc as awf_module
+            awf = awf_module
+        except ImportError as e:
+            colored_print(f"[WARN] awsmfunc could not be imported: {e}", Colors.YELLOW)
+            AWSMFUNC_AVAILABLE = False
+    return awf
+
+def try_import_opencv(import_now: bool = True):
+    """Try to import OpenCV; with import_now=False only check that it is installed (see get_cv2)"""
     global cv2, OPENCV_AVAILABLE
+    if not import_now:
+        OPENCV_AVAILABLE = importlib.util.find_spec("cv2") is not None
+        if OPENCV_AVAILABLE:
+            colored_print("[OK] OpenCV detected (imported on first use)", Colors.GREEN)
+        else:
+            colored_print("[ERROR] OpenCV not available", Colors.RED)
+        return OPENCV_AVAILABLE
     try:
         import cv2 as cv2_module
         cv2 = cv2_module
@@ -100,6 +181,18 @@ def try_import_opencv():
         colored_print(f"[ERROR] OpenCV not available: {e}", Colors.RED)
         return False
 
+def get_cv2():
+    """Import OpenCV the first time it is needed; returns None when it is unavailable"""
+    global cv2, OPENCV_AVAILABLE
+    if cv2 is None and OPENCV_AVAILABLE:
+        try:
+            import cv2 as cv2_module
+            cv2 = cv2_module
+        except ImportError as e:
+            colored_print(f"[WARN] OpenCV could not be imported: {e}", Colors.YELLOW)
+            OPENCV_AVAILABLE = False
+    return cv2
+
 def try_import_pil():
     """Try to import PIL/Pillow"""
     global PIL_Image, PIL_ImageDraw, PIL_ImageFont, PIL_AVAILABLE
@@ -154,15 +247,31 @@ def try_import_numpy():
         colored_print(f"[ERROR] NumPy not available: {e}", Colors.RED)
         return False
 
+def try_import_pyspng():
+    """Try to import pyspng (optional libspng-based PNG encoder)"""
+    global pyspng, PYSPNG_AVAILABLE
+    try:
+        import pyspng as pyspng_module
+        pyspng = pyspng_module
+        PYSPNG_AVAILABLE = True
+        colored_print("[OK] pyspng detected and imported successfully (fast PNG encoding)", Colors.GREEN)
+        return True
+    except ImportError:
+        colored_print("[WARN] pyspng not available (optional for faster PNG encoding)", Colors.YELLOW)
+        return False
+
 def detect_available_libraries():
     """Detect which libraries are available and set up the processing mode"""
     colored_print("[INFO] Detecting available video processing libraries...", Colors.CYAN, bold=True)
     
     # Try to import all libraries
     vs_available = try_import_vapoursynth()
-    cv_available = try_import_opencv() 
+    # OpenCV is only a fallback backend (and the preview window) when VapourSynth is present,
+    # so skip its fairly heavy import until something actually uses it
+    cv_available = try_import_opencv(import_now=not vs_available)
     pil_available = try_import_pil()
     numpy_available = try_import_numpy()
+    try_import_pyspng()
     
     if vs_available:
         colored_print("\n[MODE] Using VapourSynth mode (high-quality video processing)", Colors.GREEN, bold=True)
@@ -198,11 +307,66 @@ def initialize_processing_mode():
 # VIDEO PROCESSING BACKEND CLASSES
 # ===============================================================================
 
+def _read_png_compression_level():
+    """Read the PNG zlib level (0-9) from COMPARE_PNG_COMPRESSION, or None for encoder defaults"""
+    value = os.environ.get('COMPARE_PNG_COMPRESSION', '').strip()
+    if not value:
+        return None
+    if value.isdigit() and 0 <= int(value) <= 9:
+        return int(value)
+    colored_print(f"[WARN] Ignoring invalid COMPARE_PNG_COMPRESSION={value!r} (expected 0-9)", Colors.YELLOW)
+    return None
+
+# Lower levels encode much faster at the cost of larger files - handy when screenshots
+# are only generated for upload. None keeps each encoder's default level.
+PNG_COMPRESSION_LEVEL = _read_png_compression_level()
+
+def _resolve_png_compression(compression_level: Optional[int]) -> Optional[int]:
+    """Per-call compression level, falling back to COMPARE_PNG_COMPRESSION (None = encoder default)"""
+    return PNG_COMPRESSION_LEVEL if compression_level is None else compression_level
+
+# VapourSynth kernels for resizing sources, picked with COMPARE_RESIZE_QUALITY. Fewer taps
+# resize faster (noticeable on 4K sources) at the cost of slightly softer detail.
+RESIZE_KERNELS = {
+    'best': ('Spline36', {}),
+    'balanced': ('Spline16', {}),
+    'fast': ('Bicubic', {'filter_param_a': 0, 'filter_param_b': 0.5}),  # Catmull-Rom
+}
+
+def _read_resize_quality():
+    """Read the source resize quality from COMPARE_RESIZE_QUALITY, defaulting to 'best'"""
+    value = os.environ.get('COMPARE_RESIZE_QUALITY', '').strip().lower()
+    if not value:
+        return 'best'
+    if value in RESIZE_KERNELS:
+        return value
+    colored_print(f"[WARN] Ignoring invalid COMPARE_RESIZE_QUALITY={value!r} (expected {', '.join(RESIZE_KERNELS)})", Colors.YELLOW)
+    return 'best'
+
+RESIZE_KERNEL, RESIZE_KERNEL_ARGS = RESIZE_KERNELS[_read_resize_quality()]
+
+def _resize_clip(clip, **kwargs):
+    """Resize a VapourSynth clip with the kernel chosen by COMPARE_RESIZE_QUALITY"""
+    return getattr(core.resize, RESIZE_KERNEL)(clip, **RESIZE_KERNEL_ARGS, **kwargs)
+
+def write_rgb_png(rgb_array, filepath: str, compression_level: Optional[int] = None):
+    """Write an RGB uint8 array as PNG, using libspng when available and PIL otherwise"""
+    compression_level = _resolve_png_compression(compression_level)
+    if PYSPNG_AVAILABLE:
+        encode_options = {} if compression_level is None else {'compress_level': compression_level}
+        with open(filepath, 'wb') as png_file:
+            png_file.write(pyspng.encode(np.ascontiguousarray(rgb_array), **encode_options))
+    else:
+        save_options = {} if compression_level is None else {'compress_level': compression_level}
+        PIL_Image.fromarray(rgb_array, 'RGB').save(filepath, **save_options)
+
 class VideoProcessor:
     """Base class for video processing backends"""
     
     def __init__(self):
         self.mode = "base"
+        # Output directories this processor has already created
+        self._made_dirs = set()
         
     def load_video(self, path: str):
         """Load a video file"""
@@ -224,25 +388,43 @@ class VideoProcessor:
         """Crop a frame"""
         raise NotImplementedError
         
-    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10)):
-        """Add text overlay to frame"""
+    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10), in_place: bool = False):
+        """Add text overlay to frame (drawing on the frame itself when in_place is set)"""
         raise NotImplementedError
         
-    def save_frame_as_png(self, frame, filepath: str):
-        """Save frame as PNG"""
+    def save_frame_as_png(self, frame, filepath: str, compression_level: Optional[int] = None):
+        """Save frame as PNG (compression_level 0-9, defaulting to COMPARE_PNG_COMPRESSION)"""
         raise NotImplementedError
+        
+    def prepare_output_dir(self, dirpath: str):
+        """Create an output directory the first time it is used, skipping the makedirs stat on later saves"""
+        if dirpath not in self._made_dirs:
+            os.makedirs(dirpath, exist_ok=True)
+            self._made_dirs.add(dirpath)
 
 class VapourSynthProcessor(VideoProcessor):
     """VapourSynth-based video processing"""
     
+    # Frame requests kept in flight per clip by get_frames (bounded by core.num_threads).
+    # Each in-flight frame holds a full decoded picture, so keep this small for 4K sources
+    PREFETCH_FRAMES = 4
+    
+    # Source clips whose RGB conversion is remembered. Each entry keeps the clip's whole filter
+    # graph alive, so only the most recently used ones are kept (10 = slow.pics' source limit)
+    RGB_CLIP_CACHE_SIZE = 10
+    
     def __init__(self):
         super().__init__()
         self.mode = "vapoursynth"
         if not VAPOURSYNTH_AVAILABLE:
             raise RuntimeError("VapourSynth not available")
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy not available (required for VapourSynth frame access)")
         # Store references to global vs and core for easy access
         self.vs = vs
         self.core = core
+        # id(source clip) -> (source clip, RGB24 clip that converted it successfully), least recently used first
+        self._rgb_clip_cache = OrderedDict()
         
         # Verify that vs and core are properly initialized
         if self.vs is None or self.core is None:
@@ -266,126 +448,219 @@ class VapourSynthProcessor(VideoProcessor):
         """Get frame count from VapourSynth clip"""
         return len(video)
         
+    def get_frames(self, video, frame_numbers):
+        """
+        Yield (frame_number, future) for each requested frame in order.
+        
+        Up to PREFETCH_FRAMES requests are kept in flight with get_frame_async, so
+        VapourSynth renders the next frames while the caller handles the current one.
+        Each future's result() returns the frame or raises its rendering error.
+        """
+        def request(n):
+            try:
+                return video.get_frame_async(n)
+            except Exception as e:
+                # e.g. frame out of range - report it through the future like a render error
+                failed = Future()
+                failed.set_exception(e)
+                return failed
+        
+        window = max(1, min(self.PREFETCH_FRAMES, self.core.num_threads))
+        frame_iter = iter(frame_numbers)
+        pending = deque((n, request(n)) for n in islice(frame_iter, window))
+        while pending:
+            frame_number, future = pending.popleft()
+            next_frame = next(frame_iter, None)
+            if next_frame is not None:
+                pending.append((next_frame, request(next_frame)))
+            yield frame_number, future
+    
+    def _get_rgb_frame(self, video, frame_number: int):
+        """Fetch a frame as RGB24, reusing the conversion clip that worked for earlier frames of the same clip"""
+        cached = self._rgb_clip_cache.get(id(video))
+        # Compare the source clip too, since ids can be reused once an evicted clip is freed
+        if cached is not None and cached[0] is video:
+            try:
+                frame_vs = cached[1].get_frame(frame_number)
+                self._rgb_clip_cache.move_to_end(id(video))
+                return frame_vs
+            except vs.Error:
+                # Frame properties changed mid-clip; probe the conversion again below
+                del self._rgb_clip_cache[id(video)]
+        
+        rgb_clip, frame_vs = self._probe_rgb_clip(video, frame_number)
+        self._rgb_clip_cache[id(video)] = (video, rgb_clip)
+        self._rgb_clip_cache.move_to_end(id(video))
+        if len(self._rgb_clip_cache) > self.RGB_CLIP_CACHE_SIZE:
+            self._rgb_clip_cache.popitem(last=False)
+        return frame_vs
+    
+    def _probe_rgb_clip(self, video, frame_number: int):
+        """Find an RGB24 conversion of the clip that works, returning the clip and the converted frame"""
+        if video.format is not None and video.format.name == 'RGB24':
+            return video, video.get_frame(frame_number)
+        
+        original_format = video.format.name if video.format is not None else video.get_frame(frame_number).format.name
+        
+        # Use a more robust conversion approach with proper colorspace handling
+        try:
+            # First try simple format conversion
+            rgb_clip = core.resize.Bicubic(video, format=vs.RGB24)
+            return rgb_clip, rgb_clip.get_frame(frame_number)
+        except vs.Error as e:
+            colored_print(f"[DEBUG] Simple RGB conversion failed for {original_format}: {e}", Colors.YELLOW)
+        
+        # If that fails, try with explicit colorspace conversion
+        try:
+            # Convert to YUV444P16 first, then to RGB with proper matrix
+            yuv_clip = core.resize.Bicubic(video, format=vs.YUV444P16)
+            rgb_clip = core.resize.Bicubic(yuv_clip, format=vs.RGB24, matrix_in_s="709")
+            frame_vs = rgb_clip.get_frame(frame_number)
+            colored_print(f"[DEBUG] Converted {original_format} via YUV444P16 with BT.709 matrix", Colors.GREEN)
+            return rgb_clip, frame_vs
+        except vs.Error as e:
+            colored_print(f"[DEBUG] BT.709 conversion failed: {e}", Colors.YELLOW)
+        
+        # Try different color matrices: BT.470 (older content), BT.601, then auto-detect
+        for matrix_kwargs, matrix_name in (({'matrix_in_s': "470bg"}, "BT.470"),
+                                           ({'matrix_in_s': "170m"}, "BT.601"),
+                                           ({'matrix_in': 1}, "auto-detect")):
+            try:
+                rgb_clip = core.resize.Bicubic(video, format=vs.RGB24, **matrix_kwargs)
+                frame_vs = rgb_clip.get_frame(frame_number)
+                colored_print(f"[DEBUG] Converted {original_format} with {matrix_name} matrix", Colors.GREEN)
+                return rgb_clip, frame_vs
+            except vs.Error as e:
+                colored_print(f"[DEBUG] {matrix_name} conversion failed: {e}", Colors.YELLOW)
+        
+        # Final fallback: use original format without conversion
+        colored_print(f"[WARN] Could not convert {original_format} to RGB24, using original format", Colors.YELLOW)
+        return video, video.get_frame(frame_number)
+    
     def get_frame(self, video, frame_number: int):
         """Get specific frame from VapourSynth clip"""
-        global np
-        if not NUMPY_AVAILABLE:
-            raise RuntimeError("NumPy not available for frame processing")
-        
         try:
-            # Get the frame from VapourSynth
-            frame_vs = video.get_frame(frame_number)
+            # Already RGB24: no conversion clip, probing or format dispatch needed
+            if video.format is not None and video.format.id == vs.RGB24:
+                return self._rgb24_to_array(video.get_frame(frame_number))
             
-            # Debug: Show original format info
-            original_format = frame_vs.format.name
+            # Get the frame from VapourSynth, converted to RGB24 where possible
+            frame_vs = self._get_rgb_frame(video, frame_number)
             
-            # Convert to RGB first to standardize format
-            if original_format != 'RGB24':
-                # Use a more robust conversion approach with proper colorspace handling
-                try:
-                    # First try simple format conversion
-                    rgb_clip = core.resize.Bicubic(video, format=vs.RGB24)
-                    frame_vs = rgb_clip.get_frame(frame_number)
-                except vs.Error as e:
-                    colored_print(f"[DEBUG] Simple RGB conversion failed for {original_format}: {e}", Colors.YELLOW)
-                    # If that fails, try with explicit colorspace conversion
-                    try:
-                        # Convert to YUV444P16 first, then to RGB with proper matrix
-                        yuv_clip = core.resize.Bicubic(video, format=vs.YUV444P16)
-                        rgb_clip = core.resize.Bicubic(yuv_clip, format=vs.RGB24, matrix_in_s="709")
-                        frame_vs = rgb_clip.get_frame(frame_number)
-                        colored_print(f"[DEBUG] Converted {original_format} via YUV444P16 with BT.709 matrix", Colors.GREEN)
-                    except vs.Error as e:
-                        colored_print(f"[DEBUG] BT.709 conversion failed: {e}", Colors.YELLOW)
-                        # Try different color matrices
-                        try:
-                            # Try with BT.470 matrix (for older content)
-                            rgb_clip = core.resize.Bicubic(video, format=vs.RGB24, matrix_in_s="470bg")
-                            frame_vs = rgb_clip.get_frame(frame_number)
-                            colored_print(f"[DEBUG] Converted {original_format} with BT.470 matrix", Colors.GREEN)
-                        except vs.Error as e:
-                            colored_print(f"[DEBUG] BT.470 conversion failed: {e}", Colors.YELLOW)
-                            try:
-                                # Try with BT.601 matrix
-                                rgb_clip = core.resize.Bicubic(video, format=vs.RGB24, matrix_in_s="170m")
-                                frame_vs = rgb_clip.get_frame(frame_number)
-                                colored_print(f"[DEBUG] Converted {original_format} with BT.601 matrix", Colors.GREEN)
-                            except vs.Error as e:
-                                colored_print(f"[DEBUG] BT.601 conversion failed: {e}", Colors.YELLOW)
-                                # Try without matrix specification (auto-detect)
-                                try:
-                                    rgb_clip = core.resize.Bicubic(video, format=vs.RGB24, matrix_in=1)
-                                    frame_vs = rgb_clip.get_frame(frame_number)
-                                    colored_print(f"[DEBUG] Converted {original_format} with auto-detect matrix", Colors.GREEN)
-                                except vs.Error as e:
-                                    colored_print(f"[DEBUG] Auto-detect conversion failed: {e}", Colors.YELLOW)
-                                    # Final fallback: use original format without conversion
-                                    colored_print(f"[WARN] Could not convert {original_format} to RGB24, using original format", Colors.YELLOW)
-                                    frame_vs = video.get_frame(frame_number)
-            
-            # Use the proper VapourSynth frame conversion method
-            # This avoids the PEP 3118 buffer format issues
-            height = frame_vs.height
-            width = frame_vs.width
-            
-            # Extract data using array() method instead of asarray with get_read_ptr
-            # This is the correct way for newer VapourSynth versions
-            frame_array = np.array(frame_vs)
+            # View each plane's buffer directly (no copy). Planes stay separate until the single
+            # pass that converts bit depth and interleaves them into the returned array
+            planes = [np.asarray(frame_vs[plane]) for plane in range(frame_vs.format.num_planes)]
+            bits_per_sample = frame_vs.format.bits_per_sample
             
             # Handle different frame formats more robustly
-            if frame_vs.format.name == 'RGB24':
-                # RGB24 format: (3, height, width) -> (height, width, 3)
-                if frame_array.ndim == 3 and frame_array.shape[0] == 3:
-                    arr = frame_array.transpose(1, 2, 0)
-                else:
-                    arr = frame_array
-            elif frame_vs.format.name in ['YUV420P8', 'YUV422P8', 'YUV444P8', 'YUV420P10', 'YUV422P10', 'YUV444P10']:
-                # YUV format: extract Y plane for grayscale, then convert to RGB
-                if frame_array.ndim == 3:
-                    # Take Y plane (luminance) and convert to RGB
-                    y_plane = frame_array[0]  # Y plane
-                    arr = np.stack([y_plane, y_plane, y_plane], axis=2)
-                else:
-                    arr = frame_array
-                    if arr.ndim == 2:
-                        arr = np.stack([arr, arr, arr], axis=2)
-            elif frame_array.ndim == 2:
-                # Grayscale frame - add channel dimension
-                arr = np.expand_dims(frame_array, axis=2)
-                arr = np.repeat(arr, 3, axis=2)  # Convert to RGB
-            elif frame_array.ndim == 3 and frame_array.shape[0] == 3:
-                # 3-plane format: transpose from (3, height, width) to (height, width, 3)
-                arr = frame_array.transpose(1, 2, 0)
+            if frame_vs.format.name == 'RGB24' or (len(planes) == 3 and frame_vs.format.color_family == vs.RGB):
+                # RGB planes: interleave into (height, width, 3)
+                arr = self._interleave_planes(planes, bits_per_sample)
+            elif frame_vs.format.name in ['YUV420P8', 'YUV422P8', 'YUV444P8', 'YUV420P10', 'YUV422P10', 'YUV444P10'] and len(planes) == 3:
+                # YUV that VapourSynth couldn't convert: do a BT.709 conversion here instead of showing luma only
+                arr = self._yuv_to_rgb_bt709(planes, bits_per_sample)
+            elif len(planes) == 1:
+                # Grayscale: present the single plane as RGB without copying it three times
+                arr = self._gray_to_rgb_view(self._to_uint8(planes[0], bits_per_sample))
+            elif len(planes) == 3 and planes[1].shape == planes[0].shape:
+                # Other unsubsampled 3-plane format: interleave as-is
+                arr = self._interleave_planes(planes, bits_per_sample)
             else:
-                # Unexpected format, try to handle it
-                colored_print(f"[WARN] Unexpected frame format: {frame_vs.format.name}, shape: {frame_array.shape}", Colors.YELLOW)
-                arr = frame_array
-                # Try to ensure it's 3D
-                if arr.ndim == 2:
-                    arr = np.stack([arr, arr, arr], axis=2)
-            
-            # Ensure data type is uint8
-            if arr.dtype != np.uint8:
-                # Handle different bit depths
-                if arr.dtype in [np.uint16, np.int16]:
-                    # 16-bit: scale down to 8-bit
-                    arr = (arr / 256).astype(np.uint8)
-                elif arr.dtype in [np.float32, np.float64]:
-                    # Float: clamp to 0-255 range
-                    arr = np.clip(arr * 255, 0, 255).astype(np.uint8)
-                else:
-                    # Other types: clamp and convert
-                    arr = np.clip(arr, 0, 255).astype(np.uint8)
+                # Unexpected format, fall back to the first plane as grayscale
+                colored_print(f"[WARN] Unexpected frame format: {frame_vs.format.name}, planes: {[plane.shape for plane in planes]}", Colors.YELLOW)
+                arr = self._gray_to_rgb_view(self._to_uint8(planes[0], bits_per_sample))
             
             return arr
             
         except Exception as e:
             print(f"[ERROR] Failed to get frame {frame_number}: {e}")
-            import traceback
             traceback.print_exc()
             # Return a black frame as fallback
             return np.zeros((480, 640, 3), dtype=np.uint8)
     
+    @staticmethod
+    def _gray_to_rgb_view(gray):
+        """
+        Broadcast a single plane to (height, width, 3) as a read-only stride-0 view.
+        
+        All three channels share the plane's memory; consumers that need a contiguous
+        buffer (PIL, PNG encoders) make their one copy when they read it.
+        """
+        return np.broadcast_to(gray[:, :, None], (*gray.shape, 3))
+    
+    @staticmethod
+    def _to_uint8(arr, bits_per_sample: int, out=None):
+        """
+        Scale integer or float samples down to uint8 without full-size integer temporaries.
+        
+        Writes into out when given (e.g. one channel of an interleaved frame). 8-bit input
+        with no out is returned as-is.
+        """
+        if arr.dtype == np.uint8:
+            if out is None:
+                return arr
+            np.copyto(out, arr)
+            return out
+        if out is None:
+            out = np.empty(arr.shape, dtype=np.uint8)
+        if arr.dtype.kind in 'ui' and bits_per_sample > 8:
+            # High bit depth: drop the extra low bits (>> 8 for 16-bit, >> 2 for 10-bit), writing uint8 directly
+            np.right_shift(arr, bits_per_sample - 8, out=out, casting='unsafe')
+        elif arr.dtype.kind == 'f':
+            # Float: scale 0-1 to 0-255 and clamp in place
+            scaled = arr * 255
+            np.clip(scaled, 0, 255, out=scaled)
+            np.copyto(out, scaled, casting='unsafe')
+        else:
+            # Other types: clamp and convert
+            np.copyto(out, np.clip(arr, 0, 255), casting='unsafe')
+        return out
+    
+    @staticmethod
+    def _yuv_to_rgb_bt709(planes, bits_per_sample: int):
+        """Convert limited-range Y, U, V planes (any chroma subsampling) to an RGB uint8 array with BT.709 coefficients"""
+        y_plane, u_plane, v_plane = planes
+        height, width = y_plane.shape
+        scale = np.float32(1 << (bits_per_sample - 8)) if bits_per_sample > 8 else np.float32(1)
+        
+        # Upsample chroma to luma size by repeating samples (nearest neighbour)
+        row_repeat = height // u_plane.shape[0]
+        col_repeat = width // u_plane.shape[1]
+        
+        def upsampled(plane):
+            if row_repeat > 1:
+                plane = np.repeat(plane, row_repeat, axis=0)
+            if col_repeat > 1:
+                plane = np.repeat(plane, col_repeat, axis=1)
+            return plane[:height, :width]
+        
+        # Work in 8-bit scale float32; each step writes in place to keep temporaries to a few planes
+        luma = y_plane.astype(np.float32)
+        luma /= scale
+        luma -= 16
+        luma *= 1.164
+        cb = upsampled(u_plane).astype(np.float32)
+        cb /= scale
+        cb -= 128
+        cr = upsampled(v_plane).astype(np.float32)
+        cr /= scale
+        cr -= 128
+        
+        rgb = np.empty((height, width, 3), dtype=np.float32)
+        np.add(luma, 1.793 * cr, out=rgb[:, :, 0])
+        np.subtract(luma, 0.213 * cb + 0.533 * cr, out=rgb[:, :, 1])
+        np.add(luma, 2.112 * cb, out=rgb[:, :, 2])
+        np.clip(rgb, 0, 255, out=rgb)
+        return rgb.astype(np.uint8)
+    
+    @classmethod
+    def _interleave_planes(cls, planes, bits_per_sample: int):
+        """Convert equally sized planes to uint8 and interleave them into one (height, width, planes) array in a single pass"""
+        out = np.empty((*planes[0].shape, len(planes)), dtype=np.uint8)
+        for channel, plane in enumerate(planes):
+            cls._to_uint8(plane, bits_per_sample, out=out[:, :, channel])
+        return out
+    
     # DEPRECATED: VSPreview CLI integration - replaced with embedded preview
     # def show_vspreview(self, videos, selected_frames=None):
     #     """Show video preview using VSPreview - DEPRECATED"""
@@ -395,56 +670,65 @@ class VapourSynthProcessor(VideoProcessor):
         
     def resize_frame(self, frame, width: int, height: int):
         """Resize frame using VapourSynth"""
-        return core.resize.Spline36(frame, width=width, height=height)
+        return _resize_clip(frame, width=width, height=height)
         
     def crop_frame(self, frame, left: int, top: int, right: int, bottom: int):
         """Crop frame using VapourSynth"""
         return core.std.Crop(frame, left=left, right=right, top=top, bottom=bottom)
         
-    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10)):
-        """Add text overlay using VapourSynth"""
+    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10), in_place: bool = False):
+        """Add text overlay using VapourSynth (clips are immutable, so in_place has no effect)"""
         # VapourSynth text overlay with enhanced styling
         return core.text.Text(frame, text, alignment=7, scale=2)
         
-    def save_frame_as_png(self, frame, filepath: str):
-        """Save frame using VapourSynth with PIL backend (more reliable than fpng)"""
+    def save_frame_as_png(self, frame, filepath: str, compression_level: Optional[int] = None):
+        """Save frame using VapourSynth with a libspng or PIL backend (more reliable than fpng)"""
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        # Convert to RGB24 for PNG output
-        rgb_frame = self.core.resize.Bicubic(frame, format=self.vs.RGB24, matrix_in_s="709")
-        
-        # Get the frame
-        vs_frame = rgb_frame.get_frame(0)
-        
-        # Convert VapourSynth frame to numpy array and save using PIL
-        global np
-        if not NUMPY_AVAILABLE:
-            raise RuntimeError("NumPy not available for frame saving")
-        from PIL import Image
-        
-        # Use the built-in frame-to-array conversion
-        # This handles all the complexity of stride, format, etc.
-        rgb_array = np.asarray(vs_frame)
+        self.prepare_output_dir(os.path.dirname(filepath))
         
-        # VapourSynth arrays are in (plane, height, width) format
-        # We need to transpose to (height, width, plane) for PIL
-        if rgb_array.ndim == 3 and rgb_array.shape[0] == 3:
-            # Transpose from (3, height, width) to (height, width, 3)
-            rgb_array = rgb_array.transpose(1, 2, 0)
+        # Convert to RGB24 for PNG output, unless the clip already is RGB24
+        vs_frame = self.rgb24_clip(frame).get_frame(0)
+        self.write_rgb_frame(vs_frame, filepath, compression_level)
         
-        # Create PIL image and save
-        img = Image.fromarray(rgb_array, 'RGB')
-        img.save(filepath)
+    def rgb24_clip(self, video):
+        """Return the clip as RGB24 for write_rgb_frame; RGB24 sources skip the conversion entirely"""
+        if video.format is not None and video.format.id == self.vs.RGB24:
+            return video
+        return self.core.resize.Bicubic(video, format=self.vs.RGB24, matrix_in_s="709")
+    
+    def write_rgb_frame(self, vs_frame, filepath: str, compression_level: Optional[int] = None):
+        """Write an already rendered RGB24 VapourSynth frame to a PNG file"""
+        write_rgb_png(self._rgb24_to_array(vs_frame), filepath, compression_level)
+    
+    @classmethod
+    def _rgb24_to_array(cls, vs_frame):
+        """Interleave an RGB24 VapourSynth frame into a (height, width, 3) uint8 array"""
+        # Each plane supports the buffer protocol (strides included), so the planes are viewed
+        # without copying and interleaved straight into the layout NumPy consumers and PNG encoders need
+        return cls._interleave_planes([np.asarray(vs_frame[0]), np.asarray(vs_frame[1]), np.asarray(vs_frame[2])], 8)
 
 class OpenCVProcessor(VideoProcessor):
     """OpenCV-based video processing"""
     
+    # Forward gaps up to this many frames are decoded with grab() instead of seeking. Kept small:
+    # interval screenshots are usually far apart, where one seek beats decoding every frame between
+    SEQUENTIAL_READ_MAX_GAP = 8
+    
+    # Captures whose read position is tracked. Each entry keeps its capture (and decoder) alive,
+    # so only the most recently read ones are kept (10 = slow.pics' source limit)
+    TRACKED_CAPTURES = 10
+    
     def __init__(self):
         super().__init__()
         self.mode = "opencv"
-        if not OPENCV_AVAILABLE or not NUMPY_AVAILABLE:
+        if get_cv2() is None or not NUMPY_AVAILABLE:
             raise RuntimeError("OpenCV or NumPy not available")
+        self.cv2 = cv2
+        # id(capture) -> (capture, index of the frame the next read() returns), least recently read first.
+        # Sources are rendered on one thread each through this shared processor, so the map is locked;
+        # decoding itself stays outside the lock (each capture is only read by its own thread)
+        self._next_frame_pos = OrderedDict()
+        self._frame_pos_lock = threading.Lock()
             
     def load_video(self, path: str):
         """Load video using OpenCV"""
@@ -459,8 +743,29 @@ class OpenCVProcessor(VideoProcessor):
         
     def get_frame(self, video, frame_number: int):
         """Get specific frame from OpenCV VideoCapture"""
-        video.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        # Track the read position ourselves; CAP_PROP_POS_FRAMES is a backend query and can be
+        # approximate right after a seek on some containers
+        with self._frame_pos_lock:
+            tracked = self._next_frame_pos.get(id(video))
+        if tracked is not None and tracked[0] is video:
+            position = tracked[1]
+        else:
+            position = int(video.get(cv2.CAP_PROP_POS_FRAMES))
+        
+        # Walk forward through nearby frames rather than seeking, which flushes the decoder.
+        # The next frame needs no grab() at all; if a grab fails part-way, seek instead
+        gap = frame_number - position
+        if not (0 <= gap <= self.SEQUENTIAL_READ_MAX_GAP and all(video.grab() for _ in range(gap))):
+            video.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
         ret, frame = video.read()
+        with self._frame_pos_lock:
+            if not ret:
+                self._next_frame_pos.pop(id(video), None)
+            else:
+                self._next_frame_pos[id(video)] = (video, frame_number + 1)
+                self._next_frame_pos.move_to_end(id(video))
+                if len(self._next_frame_pos) > self.TRACKED_CAPTURES:
+                    self._next_frame_pos.popitem(last=False)
         if not ret:
             raise RuntimeError(f"Could not read frame {frame_number}")
         return frame
@@ -474,10 +779,10 @@ class OpenCVProcessor(VideoProcessor):
         height, width = frame.shape[:2]
         return frame[top:height-bottom, left:width-right]
         
-    def add_text_overlay(self, frame, text: str, position: tuple = (10, 30)):
+    def add_text_overlay(self, frame, text: str, position: tuple = (10, 30), in_place: bool = False):
         """Add text overlay using OpenCV"""
-        # Create a copy to avoid modifying original
-        overlay_frame = frame.copy()
+        # Create a copy to avoid modifying original, unless the caller owns the frame
+        overlay_frame = frame if in_place else frame.copy()
         
         # Use a more readable font and larger size
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -491,16 +796,21 @@ class OpenCVProcessor(VideoProcessor):
         
         return overlay_frame
         
-    def save_frame_as_png(self, frame, filepath: str):
+    def save_frame_as_png(self, frame, filepath: str, compression_level: Optional[int] = None):
         """Save frame as PNG using OpenCV"""
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        self.prepare_output_dir(os.path.dirname(filepath))
         
-        # Convert BGR to RGB for proper color representation
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        success = cv2.imwrite(filepath, cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR))
+        # Frames are already BGR, which is what OpenCV's PNG encoder expects
+        compression_level = _resolve_png_compression(compression_level)
+        png_params = [] if compression_level is None else [cv2.IMWRITE_PNG_COMPRESSION, compression_level]
+        success, png_data = cv2.imencode('.png', frame, png_params)
         if not success:
             raise RuntimeError(f"Failed to save frame to {filepath}")
+        
+        # Write the encoded buffer with Python's file I/O, which also handles non-ASCII paths on Windows
+        with open(filepath, 'wb') as png_file:
+            png_file.write(png_data)
 
 class PILProcessor(VideoProcessor):
     """PIL-based image processing (limited video support)"""
@@ -510,6 +820,14 @@ class PILProcessor(VideoProcessor):
         self.mode = "pil"
         if not PIL_AVAILABLE or not NUMPY_AVAILABLE:
             raise RuntimeError("PIL or NumPy not available")
+        
+        # Parse the overlay font once for the processor's lifetime
+        try:
+            # Try to use a nice font
+            self._overlay_font = PIL_ImageFont.truetype("arial.ttf", 24)
+        except OSError:
+            # Fallback to Pillow's bundled font at the same size
+            self._overlay_font = PIL_ImageFont.load_default(size=24)
             
     def load_video(self, path: str):
         """Load video frames using PIL (very basic, frame extraction only)"""
@@ -536,35 +854,27 @@ class PILProcessor(VideoProcessor):
         width, height = frame.size
         return frame.crop((left, top, width - right, height - bottom))
         
-    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10)):
+    def add_text_overlay(self, frame, text: str, position: tuple = (10, 10), in_place: bool = False):
         """Add text overlay using PIL"""
-        # Create a copy to avoid modifying original
-        overlay_frame = frame.copy()
+        # Create a copy to avoid modifying original, unless the caller owns the frame
+        overlay_frame = frame if in_place else frame.copy()
         draw = PIL_ImageDraw.Draw(overlay_frame)
         
-        try:
-            # Try to use a nice font
-            font = PIL_ImageFont.truetype("arial.ttf", 24)
-        except:
-            # Fallback to default font
-            font = PIL_ImageFont.load_default()
-            
-        # Add text with outline for better readability
-        x, y = position
-        # Black outline
-        for adj in range(-2, 3):
-            for adj2 in range(-2, 3):
-                draw.text((x + adj, y + adj2), text, font=font, fill='black')
-        # White text
-        draw.text(position, text, font=font, fill='white')
+        # White text with a black outline for better readability, rasterized in a single pass
+        draw.text(position, text, font=self._overlay_font, fill='white', stroke_width=2, stroke_fill='black')
         
         return overlay_frame
         
-    def save_frame_as_png(self, frame, filepath: str):
-        """Save frame as PNG using PIL"""
+    def save_frame_as_png(self, frame, filepath: str, compression_level: Optional[int] = None):
+        """Save frame as PNG using PIL (or libspng for RGB frames when pyspng is installed)"""
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        frame.save(filepath, 'PNG')
+        self.prepare_output_dir(os.path.dirname(filepath))
+        if PYSPNG_AVAILABLE and frame.mode == 'RGB':
+            write_rgb_png(np.asarray(frame), filepath, compression_level)
+            return
+        compression_level = _resolve_png_compression(compression_level)
+        save_options = {} if compression_level is None else {'compress_level': compression_level}
+        frame.save(filepath, 'PNG', **save_options)
 
 # ===============================================================================
 # PROCESSOR FACTORY
@@ -664,6 +974,17 @@ def show_cli_preview(videos, comparison_type):
         colored_print(f"[❌] CLI preview error: {e}", Colors.RED)
         return None
 
+def _render_console_preview_status(current_frame, frame_count, preview_frames):
+    """Draw the console preview status lines with one write and one flush"""
+    lines = [colorize(f"[PREVIEW] Frame: {current_frame + 1}/{frame_count}", Colors.WHITE, bold=True)]
+    if preview_frames:
+        selected_str = ", ".join(str(f + 1) for f in sorted(preview_frames))
+        lines.append(colorize(f"[SELECTED] Frames: {selected_str}", Colors.YELLOW))
+    out = sys.stdout
+    if out is not None:
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+
 def show_simple_console_preview(video_config):
     """
     Simple console-based frame preview for CLI fallback
@@ -681,13 +1002,8 @@ def show_simple_console_preview(video_config):
         
         while True:
             try:
-                # Show frame info
-                frame_info = f"Frame: {current_frame + 1}/{frame_count}"
-                colored_print(f"[PREVIEW] {frame_info}", Colors.WHITE, bold=True)
-                
-                if preview_frames:
-                    selected_str = ", ".join(str(f + 1) for f in sorted(preview_frames))
-                    colored_print(f"[SELECTED] Frames: {selected_str}", Colors.YELLOW)
+                # Show frame info and selection as a single write per keypress
+                _render_console_preview_status(current_frame, frame_count, preview_frames)
                 
                 # Get user input
                 nav = input("Navigation (n/p/a/q) or frame number: ").strip().lower()
@@ -736,24 +1052,215 @@ def show_simple_console_preview(video_config):
 # UPLOAD FUNCTIONS
 # ===============================================================================
 
+# Backoff delays (seconds) when polling for screenshots that are still being written
+_IMAGE_RESCAN_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+
+# Number of images uploaded to slow.pics in parallel
+SLOWPICS_UPLOAD_WORKERS = 8
+SLOWPICS_SEND_BLOCKSIZE = 64 * 1024
+
+# Upload size aimed for per comparison when a large upload has to be split into parts
+SLOWPICS_CHUNK_TARGET_BYTES = 800 * 1024 * 1024
+
+# Retries for the session page request, with exponential backoff that honours Retry-After.
+# POSTs stream their bodies, which urllib3 can't replay - see _send_with_backoff.
+# raise_on_status=False hands the last response back so its status ends up in the error message.
+_SLOWPICS_RETRY = Retry(
+    total=3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    backoff_factor=2,
+    allowed_methods=frozenset(('GET',)),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Backoff delays (seconds) before re-sending a POST that was rate limited, hit a server error or timed out
+_UPLOAD_RETRY_DELAYS = (2, 4, 8)
+_RETRYABLE_UPLOAD_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Headers shared by every slow.pics upload request; only the body headers and XSRF token vary
+_SLOWPICS_BASE_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Access-Control-Allow-Origin": "*",
+    "Connection": "keep-alive",
+    "Origin": "https://slow.pics/",
+    "Referer": "https://slow.pics/comparison",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36",
+}
+
 def _get_slowpics_header(content_length: str, content_type: str, sess: Session) -> Dict[str, str]:
     """
     Generate headers for slow.pics upload requests.
     Adapted from working comp.py implementation.
     """
+    # Look the token up directly instead of building a dict of the whole cookie jar
+    xsrf_token = sess.cookies.get("XSRF-TOKEN")
+    if xsrf_token is None:
+        raise KeyError("XSRF-TOKEN")
     return {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Access-Control-Allow-Origin": "*",
+        **_SLOWPICS_BASE_HEADERS,
         "Content-Length": content_length,
         "Content-Type": content_type,
-        "Origin": "https://slow.pics/",
-        "Referer": "https://slow.pics/comparison",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36",
-        "X-XSRF-TOKEN": sess.cookies.get_dict()["XSRF-TOKEN"]
+        "X-XSRF-TOKEN": xsrf_token
     }
 
+class _SlowpicsAdapter(HTTPAdapter):
+    """HTTPAdapter that sends streamed request bodies in larger blocks"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        # http.client reads file-like bodies 8 KiB at a time; larger blocks mean fewer send() calls per image
+        kwargs.setdefault('blocksize', SLOWPICS_SEND_BLOCKSIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+def _create_slowpics_session() -> Session:
+    """Create a session whose connection pool keeps one connection per upload worker alive"""
+    sess = Session()
+    adapter = _SlowpicsAdapter(pool_connections=1, pool_maxsize=SLOWPICS_UPLOAD_WORKERS)
+    sess.mount('https://slow.pics/', adapter)
+    # The session page has no body, so its retries can be left to the pool
+    sess.mount('https://slow.pics/comparison', HTTPAdapter(max_retries=_SLOWPICS_RETRY))
+    return sess
+
+# Multipart boundaries only have to be unique per body, so a per-process random prefix plus a
+# counter replaces a uuid4 (an os.urandom call) for every request
+_BOUNDARY_PREFIX = secrets.token_hex(8)
+_boundary_counter = count()
+
+def _multipart_boundary() -> str:
+    """Return a fresh multipart boundary for a slow.pics request body"""
+    return f"{_BOUNDARY_PREFIX}{next(_boundary_counter):x}"
+
+# Screenshot extensions accepted when scanning existing folders (tuple so endswith checks both in C)
+_PNG_SUFFIXES = ('.png', '.PNG')
+
+def _index_screenshots(source_folder: str, source_name: str) -> Dict[int, str]:
+    """
+    Map frame numbers to screenshot paths with a single directory scan.
+    
+    Frame numbers come from _parse_screenshot_frame_number, the same parser upload-only
+    mode counts folders with, so user-supplied names (Name_42.png, Name_000000_000000.png)
+    resolve too. The canonical SourceName_000000.png wins when several files share a frame.
+    """
+    prefix = f"{source_name}_"
+    index = {}
+    canonical = set()
+    with os.scandir(source_folder) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith(_PNG_SUFFIXES) or not entry.is_file():
+                continue
+            frame_num = _parse_screenshot_frame_number(filename)
+            if frame_num is None or frame_num in canonical:
+                continue
+            index[frame_num] = entry.path
+            if filename == f"{prefix}{frame_num:06d}.png":
+                canonical.add(frame_num)
+    return index
+
+def _post_slowpics_image(sess: Session, collection: str, browser_id: str, image_path: str, image_id: str):
+    """Send one image upload request and return the response"""
+    # Every imageUuid is its own slot in the comparison and must receive a file, so identical
+    # frames (e.g. bit-identical sources) can't be deduplicated by skipping the upload.
+    # Hand the open file to the encoder so the PNG is streamed in chunks rather than read into memory
+    with open(image_path, 'rb') as image_file:
+        if hasattr(os, 'posix_fadvise'):
+            # Whole file is read front to back; let the kernel read ahead while earlier chunks are sent
+            os.posix_fadvise(image_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        upload_info = {
+            "collectionUuid": collection,
+            "imageUuid": image_id,
+            "file": (os.path.basename(image_path), image_file, 'image/png'),
+            'browserId': browser_id,
+        }
+        
+        upload_info_encoded = MultipartEncoder(upload_info, _multipart_boundary())
+        upload_response = sess.post(
+            'https://slow.pics/upload/image', 
+            data=upload_info_encoded,  # Stream the encoder instead of materialising the body
+            headers=_get_slowpics_header(str(upload_info_encoded.len), upload_info_encoded.content_type, sess),
+            timeout=60
+        )
+    return upload_response
+
+def _send_with_backoff(send):
+    """
+    Call send() until the response is not rate limited or a server error, sleeping between attempts.
+    
+    For streamed POST bodies, which a consumed encoder can't replay: send() must build a fresh
+    request body on every call. Timeouts are retried too; the last response is returned as is.
+    """
+    for delay in (*_UPLOAD_RETRY_DELAYS, None):
+        try:
+            response = send()
+        except requests.exceptions.Timeout:
+            if delay is None:
+                raise
+        else:
+            if response.status_code not in _RETRYABLE_UPLOAD_STATUSES or delay is None:
+                return response
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+        time.sleep(delay)
+
+def _upload_slowpics_image(sess: Session, collection: str, browser_id: str, image_path: str, image_id: str):
+    """Upload a single image into an existing slow.pics comparison, backing off while the server is busy"""
+    # With several workers uploading at once, a 429 on one image shouldn't fail the whole comparison
+    upload_response = _send_with_backoff(
+        lambda: _post_slowpics_image(sess, collection, browser_id, image_path, image_id))
+    
+    if upload_response.status_code != 200 or upload_response.content.decode() != "OK":
+        raise Exception(f"Failed to upload image {os.path.basename(image_path)}. Status: {upload_response.status_code}")
+
+# Six-digit frame numbers embedded anywhere in a screenshot name (fallback for non-standard names)
+_SIX_DIGIT_RE = re.compile(r'\d{6}')
+
+def _parse_screenshot_frame_number(png_file: str) -> Optional[int]:
+    """Extract the frame number from a screenshot filename, or None when it has none"""
+    # Handle multiple possible formats:
+    # Format 1: SourceName_000000.png (your format)
+    # Format 2: SourceName_000000_000000.png (alternative format)
+    stem = png_file[:-4] if png_file.endswith(_PNG_SUFFIXES) else png_file
+    # Only the part after the last underscore matters, so split once from the right
+    parts = stem.rsplit('_', 1)
+    if len(parts) < 2:
+        return None
+    # Usual case: the last part after an underscore is the frame number (checked without raising)
+    frame_part = parts[1]
+    if frame_part.isdecimal():
+        return int(frame_part)
+    # Otherwise use the last 6-digit number in the filename
+    numbers = _SIX_DIGIT_RE.findall(png_file)
+    return int(numbers[-1]) if numbers else None
+
+def _scan_source_folder(folder_path: str):
+    """
+    Count, sample and parse the PNGs of one screenshot folder in a single pass.
+    
+    Returns (png_count, first three PNG names, sorted frame numbers parsed from the names).
+    """
+    png_count = 0
+    sample_files = []
+    folder_frames = []
+    with os.scandir(folder_path) as files:
+        for png_entry in files:
+            png_file = png_entry.name
+            if not png_file.endswith(_PNG_SUFFIXES) or not png_entry.is_file():
+                continue
+            png_count += 1
+            if len(sample_files) < 3:
+                sample_files.append(png_file)
+            # Extract frame number from filename
+            frame_num = _parse_screenshot_frame_number(png_file)
+            if frame_num is not None:
+                folder_frames.append(frame_num)
+    # Sort in the worker thread so the caller only has to merge
+    folder_frames.sort()
+    return png_count, sample_files, folder_frames
+
 def get_upload_only_config():
     """Get configuration for uploading existing screenshots only"""
     print_header("UPLOAD EXISTING SCREENSHOTS")
@@ -761,66 +1268,54 @@ def get_upload_only_config():
     # Analyze existing screenshots to determine sources and frames
     screenshots_folder = "Screenshots"
     source_folders = []
-    all_frames = set()
-    
-    for item in os.listdir(screenshots_folder):
-        item_path = os.path.join(screenshots_folder, item)
-        if os.path.isdir(item_path):
-            png_files = [f for f in os.listdir(item_path) if f.endswith('.png')]
-            if png_files:
-                source_folders.append(item)
-                # Extract frame numbers from filenames
-                for png_file in png_files:
-                    try:
-                        # Handle multiple possible formats:
-                        # Format 1: SourceName_000000.png (your format)
-                        # Format 2: SourceName_000000_000000.png (alternative format)
-                        parts = png_file.replace('.png', '').split('_')
-                        if len(parts) >= 2:
-                            # Try to get the frame number from the last numeric part
-                            frame_part = parts[-1]  # Get the last part after underscore
-                            frame_num = int(frame_part)
-                            all_frames.add(frame_num)
-                    except (ValueError, IndexError):
-                        # If parsing fails, try alternative approach
-                        try:
-                            # Look for 6-digit numbers in the filename
-                            import re
-                            numbers = re.findall(r'\d{6}', png_file)
-                            if numbers:
-                                frame_num = int(numbers[-1])  # Use the last 6-digit number
-                                all_frames.add(frame_num)
-                        except (ValueError, IndexError):
-                            continue
-    
-    frames = sorted(list(all_frames))
-    
-    colored_print(f"[DIRS] Found {len(source_folders)} video sources:", Colors.GREEN, bold=True)
-    for i, source in enumerate(source_folders):
-        source_path = os.path.join(screenshots_folder, source)
-        png_files = [f for f in os.listdir(source_path) if f.endswith('.png')]
-        png_count = len(png_files)
-        colored_print(f"   {i+1}. {source} ({png_count} screenshots)", Colors.CYAN)
-        
-        # Show sample filenames to help user verify
-        if png_files:
-            sample_files = png_files[:3]  # Show first 3 files
+    source_summaries = {}  # source folder -> (PNG count, first few PNG names) for the summary below
+    
+    # scandir entries carry their type, so no extra stat per entry is needed
+    with os.scandir(screenshots_folder) as entries:
+        source_entries = [entry for entry in entries if entry.is_dir()]
+    
+    # Scan the source folders concurrently; directory listing releases the GIL, which pays off on
+    # network shares and spinning disks. map() keeps the results in directory order
+    scan_results = []
+    if source_entries:
+        with ThreadPoolExecutor(max_workers=min(8, len(source_entries))) as executor:
+            scan_results = list(executor.map(_scan_source_folder, [entry.path for entry in source_entries]))
+    
+    for source_entry, (png_count, sample_files, folder_frames) in zip(source_entries, scan_results):
+        if png_count:
+            source_folders.append(source_entry.name)
+            source_summaries[source_entry.name] = (png_count, sample_files)
+    
+    # Each folder's frames are already sorted: merge them in one linear pass, dropping duplicates
+    frames = []
+    for frame_num in heapq.merge(*(folder_frames for _, _, folder_frames in scan_results)):
+        if not frames or frames[-1] != frame_num:
+            frames.append(frame_num)
+    
+    # The summary can run to hundreds of lines; send it to the terminal in one write
+    with _batched_output():
+        colored_print(f"[DIRS] Found {len(source_folders)} video sources:", Colors.GREEN, bold=True)
+        for i, source in enumerate(source_folders):
+            png_count, sample_files = source_summaries[source]
+            colored_print(f"   {i+1}. {source} ({png_count} screenshots)", Colors.CYAN)
+        
+            # Show sample filenames (first 3 files) to help user verify
             for sample in sample_files:
                 colored_print(f"      - {sample}", Colors.WHITE)
-            if len(png_files) > 3:
-                colored_print(f"      - ... and {len(png_files) - 3} more files", Colors.WHITE)
-    
-    colored_print(f"\n[IMAGE]  Found {len(frames)} unique frames", Colors.BLUE, bold=True)
-    if len(frames) <= 20:
-        colored_print(f"   Frames: {frames}", Colors.WHITE)
-    else:
-        colored_print(f"   Frames: {frames[:10]} ... {frames[-5:]} (showing first 10 and last 5)", Colors.WHITE)
-    
-    colored_print(f"\n[INFO] Total screenshots to upload: {len(frames) * len(source_folders)}", Colors.MAGENTA, bold=True)
+            if png_count > 3:
+                colored_print(f"      - ... and {png_count - 3} more files", Colors.WHITE)
+        
+        colored_print(f"\n[IMAGE]  Found {len(frames)} unique frames", Colors.BLUE, bold=True)
+        if len(frames) <= 20:
+            colored_print(f"   Frames: {frames}", Colors.WHITE)
+        else:
+            colored_print(f"   Frames: {frames[:10]} ... {frames[-5:]} (showing first 10 and last 5)", Colors.WHITE)
+        
+        colored_print(f"\n[INFO] Total screenshots to upload: {len(frames) * len(source_folders)}", Colors.MAGENTA, bold=True)
     
     # Get slow.pics upload options
     colored_print("\n[UPLOAD] slow.pics Upload Options", Colors.YELLOW, bold=True)
-    show_name = input(f"{Colors.CYAN}Enter show/movie name: {Colors.END}").strip()
+    show_name = input(colorize("Enter show/movie name: ", Colors.CYAN)).strip()
     if not show_name:
         colored_print("[ERROR] Show/movie name is required for upload. Exiting.", Colors.RED, bold=True)
         sys.exit(0)
@@ -830,24 +1325,16 @@ def get_upload_only_config():
     colored_print("1. [TV] Yes (TV series)", Colors.GREEN)
     colored_print("2. [MOVIE] No (Movie)", Colors.BLUE)
     
-    while True:
-        try:
-            series_choice = int(input(f"\n{Colors.CYAN}Enter choice (1 or 2): {Colors.END}"))
-            if series_choice in [1, 2]:
-                if series_choice == 1:
-                    colored_print("[OK] TV series selected!", Colors.GREEN, bold=True)
-                else:
-                    colored_print("[OK] Movie selected!", Colors.GREEN, bold=True)
-                break
-            else:
-                colored_print("[ERROR] Please enter 1 or 2.", Colors.RED)
-        except ValueError:
-            colored_print("[ERROR] Please enter a valid number.", Colors.RED)
+    series_choice = _prompt_choice("\n" + colorize("Enter choice (1 or 2): ", Colors.CYAN), (1, 2), "Please enter 1 or 2.", colored=True)
+    if series_choice == 1:
+        colored_print("[OK] TV series selected!", Colors.GREEN, bold=True)
+    else:
+        colored_print("[OK] Movie selected!", Colors.GREEN, bold=True)
     
     season_number = ""
     episode_number = ""
     if series_choice == 1:
-        season_input = input(f"{Colors.CYAN}Enter season number (e.g., 1, 2, 3): {Colors.END}").strip()
+        season_input = input(colorize("Enter season number (e.g., 1, 2, 3): ", Colors.CYAN)).strip()
         if season_input:
             try:
                 season_num = int(season_input)
@@ -859,28 +1346,20 @@ def get_upload_only_config():
                 colored_print("1. [SEASON] Full season/season pack", Colors.GREEN)
                 colored_print("2. [EPISODE] Single episode", Colors.BLUE)
                 
-                while True:
-                    try:
-                        episode_choice = int(input(f"\n{Colors.CYAN}Enter choice (1 or 2): {Colors.END}"))
-                        if episode_choice in [1, 2]:
-                            if episode_choice == 1:
-                                colored_print("[OK] Season pack selected!", Colors.GREEN, bold=True)
-                            else:
-                                colored_print("[OK] Single episode selected!", Colors.GREEN, bold=True)
-                                episode_input = input(f"{Colors.CYAN}Enter episode number (e.g., 1, 2, 15): {Colors.END}").strip()
-                                if episode_input:
-                                    try:
-                                        episode_num = int(episode_input)
-                                        episode_number = f"E{episode_num:02d}"
-                                        colored_print(f"[OK] Episode {episode_num} configured!", Colors.GREEN, bold=True)
-                                    except ValueError:
-                                        colored_print("[WARN] Invalid episode number, continuing without episode.", Colors.YELLOW)
-                                        episode_number = ""
-                            break
-                        else:
-                            colored_print("[ERROR] Please enter 1 or 2.", Colors.RED)
-                    except ValueError:
-                        colored_print("[ERROR] Please enter a valid number.", Colors.RED)
+                episode_choice = _prompt_choice("\n" + colorize("Enter choice (1 or 2): ", Colors.CYAN), (1, 2), "Please enter 1 or 2.", colored=True)
+                if episode_choice == 1:
+                    colored_print("[OK] Season pack selected!", Colors.GREEN, bold=True)
+                else:
+                    colored_print("[OK] Single episode selected!", Colors.GREEN, bold=True)
+                    episode_input = input(colorize("Enter episode number (e.g., 1, 2, 15): ", Colors.CYAN)).strip()
+                    if episode_input:
+                        try:
+                            episode_num = int(episode_input)
+                            episode_number = f"E{episode_num:02d}"
+                            colored_print(f"[OK] Episode {episode_num} configured!", Colors.GREEN, bold=True)
+                        except ValueError:
+                            colored_print("[WARN] Invalid episode number, continuing without episode.", Colors.YELLOW)
+                            episode_number = ""
                         
             except ValueError:
                 colored_print("[WARN] Invalid season number, continuing without season.", Colors.YELLOW)
@@ -914,23 +1393,14 @@ def get_user_input():
     colored_print("1. [DIR] Multiple sources comparison (compare different sources)", Colors.GREEN)
     colored_print("2. [VS] Source vs Encode comparison (compare original with encoded version)", Colors.BLUE)
     
-    while True:
-        try:
-            choice_input = input(f"\n{Colors.CYAN}Enter choice (1 or 2): {Colors.END}")
-            comparison_type = int(choice_input)
-            if comparison_type in [1, 2]:
-                if comparison_type == 1:
-                    colored_print("[OK] Multiple sources comparison selected!", Colors.GREEN, bold=True)
-                else:
-                    colored_print("[OK] Source vs Encode comparison selected!", Colors.GREEN, bold=True)
-                break
-            else:
-                colored_print("[ERROR] Please enter 1 or 2.", Colors.RED)
-        except ValueError:
-            colored_print("[ERROR] Please enter a valid number.", Colors.RED)
+    comparison_type = _prompt_choice("\n" + colorize("Enter choice (1 or 2): ", Colors.CYAN), (1, 2), "Please enter 1 or 2.", colored=True)
+    if comparison_type == 1:
+        colored_print("[OK] Multiple sources comparison selected!", Colors.GREEN, bold=True)
+    else:
+        colored_print("[OK] Source vs Encode comparison selected!", Colors.GREEN, bold=True)
     
     # Check if Screenshots folder exists and has content
-    screenshots_folder_exists = os.path.exists("Screenshots") and os.path.isdir("Screenshots")
+    screenshots_folder_exists = os.path.isdir("Screenshots")  # isdir is False for missing paths too
     has_existing_screenshots = False
     
     if screenshots_folder_exists:
@@ -938,7 +1408,7 @@ def get_user_input():
         for item in os.listdir("Screenshots"):
             item_path = os.path.join("Screenshots", item)
             if os.path.isdir(item_path):
-                png_files = [f for f in os.listdir(item_path) if f.endswith('.png')]
+                png_files = [f for f in os.listdir(item_path) if f.endswith(_PNG_SUFFIXES)]
                 if png_files:
                     has_existing_screenshots = True
                     break
@@ -951,21 +1421,13 @@ def get_user_input():
         colored_print("2. [UP] Upload existing screenshots to slow.pics", Colors.BLUE)
         colored_print("3. [EXIT] Exit", Colors.RED)
         
-        while True:
-            try:
-                choice = int(input(f"\n{Colors.CYAN}Enter your choice (1-3): {Colors.END}"))
-                if choice in [1, 2, 3]:
-                    if choice == 2:
-                        colored_print("[OK] Upload existing screenshots selected!", Colors.GREEN, bold=True)
-                    elif choice == 3:
-                        colored_print("[EXIT] Goodbye!", Colors.YELLOW, bold=True)
-                    else:
-                        colored_print("[OK] Generate new screenshots selected!", Colors.GREEN, bold=True)
-                    break
-                else:
-                    colored_print("[ERROR] Please enter 1, 2, or 3.", Colors.RED)
-            except ValueError:
-                colored_print("[ERROR] Please enter a valid number.", Colors.RED)
+        choice = _prompt_choice("\n" + colorize("Enter your choice (1-3): ", Colors.CYAN), (1, 2, 3), "Please enter 1, 2, or 3.", colored=True)
+        if choice == 2:
+            colored_print("[OK] Upload existing screenshots selected!", Colors.GREEN, bold=True)
+        elif choice == 3:
+            colored_print("[EXIT] Goodbye!", Colors.YELLOW, bold=True)
+        else:
+            colored_print("[OK] Generate new screenshots selected!", Colors.GREEN, bold=True)
         
         if choice == 3:
             print("Exiting...")
@@ -980,20 +1442,77 @@ def get_user_input():
     else:
         return get_source_vs_encode_config()
 
+def _prompt_choice(prompt: str, choices, range_error: str, colored: bool = False) -> int:
+    """Ask until one of the numeric choices is entered, reporting errors in the calling prompt's style"""
+    valid = frozenset(choices)
+    while True:
+        answer = input(prompt).strip()
+        if not answer.isdecimal():
+            error = "Please enter a valid number."
+        elif int(answer) in valid:
+            return int(answer)
+        else:
+            error = range_error
+        if colored:
+            colored_print(f"[ERROR] {error}", Colors.RED)
+        else:
+            print(error)
+
+def _prompt_existing_path(prompt: str) -> str:
+    """Ask for a file path until an existing one is entered (surrounding quotes are stripped)"""
+    while True:
+        path = input(prompt).strip('"')
+        if os.path.exists(path):
+            return path
+        print(f"File not found: {path}. Please try again.")
+
+# Recently shown preview frames kept in memory, so stepping back or re-showing a frame skips decoding
+PREVIEW_CACHE_FRAMES = 16
+
+def _get_preview_frame(processor, video, frame_number: int, cache: OrderedDict):
+    """Fetch a preview frame through a small LRU cache of recently shown frames"""
+    frame = cache.get(frame_number)
+    if frame is None:
+        frame = processor.get_frame(video, frame_number)
+        cache[frame_number] = frame
+        if len(cache) > PREVIEW_CACHE_FRAMES:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(frame_number)
+    return frame
+
+PREVIEW_WINDOW_NAME = "Frame Preview"
+
+def _show_preview_image(arr, is_bgr: bool, use_window: bool) -> bool:
+    """
+    Show a preview frame, reusing one OpenCV window instead of launching an image viewer per frame.
+    
+    Returns whether the window can be used for the next frame. Headless OpenCV builds can't
+    open windows; the frame then goes to PIL's external viewer as before.
+    """
+    if arr.dtype != np.uint8:
+        arr = arr.astype(np.uint8)
+    if use_window and get_cv2() is not None:
+        try:
+            bgr = arr if is_bgr else cv2.cvtColor(np.ascontiguousarray(arr), cv2.COLOR_RGB2BGR)
+            cv2.namedWindow(PREVIEW_WINDOW_NAME, cv2.WINDOW_NORMAL)  # no-op once the window exists
+            cv2.imshow(PREVIEW_WINDOW_NAME, bgr)
+            cv2.waitKey(1)  # let the window repaint
+            return True
+        except cv2.error:
+            pass
+    if is_bgr:
+        # One pass into a contiguous RGB buffer; a [:, :, ::-1] view would make PIL copy it again
+        arr = cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
+    PIL_Image.fromarray(arr, 'RGB').show()
+    return False
+
 def get_multiple_sources_config():
     """Get configuration for multiple sources comparison"""
     print("\n=== Multiple Sources Comparison ===")
     
     # Get number of video sources
-    while True:
-        try:
-            num_videos = int(input("How many video sources do you want to compare? (2-10): "))
-            if 2 <= num_videos <= 10:
-                break
-            else:
-                print("Please enter a number between 2 and 10.")
-        except ValueError:
-            print("Please enter a valid number.")
+    num_videos = _prompt_choice("How many video sources do you want to compare? (2-10): ", range(2, 11), "Please enter a number between 2 and 10.")
     
     videos = []
     
@@ -1002,12 +1521,7 @@ def get_multiple_sources_config():
         print(f"\n--- Video Source {i+1} ---")
         
         # Get video file path
-        while True:
-            video_path = input(f"Enter path to video {i+1}: ").strip('"')
-            if os.path.exists(video_path):
-                break
-            else:
-                print(f"File not found: {video_path}. Please try again.")
+        video_path = _prompt_existing_path(f"Enter path to video {i+1}: ")
         
         # Get display name
         default_name = f"Source{i+1}"
@@ -1029,10 +1543,16 @@ def get_multiple_sources_config():
                 colored_print("[PREVIEW] Navigation: n=next, p=previous, a=add frame, q=quit preview", Colors.BLUE)
                 
                 current_frame = 0
+                frame_cache = OrderedDict()
+                # Whether frames can be shown as images is fixed for the session; check it once
+                can_display = NUMPY_AVAILABLE and PIL_AVAILABLE
+                if not can_display:
+                    colored_print("[WARN] NumPy and PIL are required for frame preview images", Colors.YELLOW)
+                use_preview_window = True
                 
                 while True:
                     try:
-                        frame = processor.get_frame(video, current_frame)
+                        frame = _get_preview_frame(processor, video, current_frame, frame_cache)
                         
                         # Get frame info
                         frame_info = f"Frame: {current_frame + 1}/{frame_count} | Display: {source_name}"
@@ -1053,27 +1573,22 @@ def get_multiple_sources_config():
                             colored_print(f"[SELECTED] Frames: {selected_str}", Colors.YELLOW)
                         
                         # Try to show frame as image (if possible)
-                        try:
-                            global np
-                            if not NUMPY_AVAILABLE:
-                                colored_print("[WARN] NumPy not available for frame preview", Colors.YELLOW)
-                                continue
-                            from PIL import Image
-                            
-                            if hasattr(frame, 'get_frame'):
-                                vs_frame = frame.get_frame(0)
-                                arr = np.asarray(vs_frame)
-                                if arr.ndim == 3 and arr.shape[0] == 3:
-                                    arr = arr.transpose(1, 2, 0)
-                            else:
-                                arr = frame
-                                if len(arr.shape) == 3:
-                                    arr = arr[:, :, ::-1]  # BGR to RGB
-                                    
-                            img = Image.fromarray(arr.astype(np.uint8), 'RGB')
-                            img.show()
-                        except Exception as e:
-                            colored_print(f"[WARN] Could not display image: {e}", Colors.YELLOW)
+                        if can_display:
+                            try:
+                                if hasattr(frame, 'get_frame'):
+                                    vs_frame = frame.get_frame(0)
+                                    arr = np.asarray(vs_frame)
+                                    if arr.ndim == 3 and arr.shape[0] == 3:
+                                        arr = arr.transpose(1, 2, 0)
+                                    is_bgr = False
+                                else:
+                                    # OpenCV decodes to BGR; the other processors return RGB
+                                    arr = frame
+                                    is_bgr = processor.mode == "opencv"
+                                
+                                use_preview_window = _show_preview_image(arr, is_bgr, use_preview_window)
+                            except Exception as e:
+                                colored_print(f"[WARN] Could not display image: {e}", Colors.YELLOW)
                         
                         # Get user input
                         nav = input("Navigation (n/p/a/q) or frame number: ").strip().lower()
@@ -1105,6 +1620,12 @@ def get_multiple_sources_config():
                     except Exception as e:
                         colored_print(f"[ERROR] Could not get frame: {e}", Colors.RED)
                         break
+                
+                if can_display and use_preview_window and cv2 is not None:
+                    try:
+                        cv2.destroyWindow(PREVIEW_WINDOW_NAME)
+                    except cv2.error:
+                        pass  # window was never opened
                         
                 if preview_frames:
                     preview_frames.sort()
@@ -1123,15 +1644,7 @@ def get_multiple_sources_config():
         print("3. Add padding only") 
         print("4. Both trim and pad")
         
-        while True:
-            try:
-                process_choice = int(input("Choose processing option (1-4): "))
-                if process_choice in [1, 2, 3, 4]:
-                    break
-                else:
-                    print("Please enter 1, 2, 3, or 4.")
-            except ValueError:
-                print("Please enter a valid number.")
+        process_choice = _prompt_choice("Choose processing option (1-4): ", (1, 2, 3, 4), "Please enter 1, 2, 3, or 4.")
         
         trim_start = trim_end = pad_start = pad_end = 0
         
@@ -1160,15 +1673,7 @@ def get_multiple_sources_config():
         print("2. Auto-detect crop (recommended)")
         print("3. Manual crop values")
         
-        while True:
-            try:
-                crop_choice = int(input("Enter choice (1-3): "))
-                if crop_choice in [1, 2, 3]:
-                    break
-                else:
-                    print("Please enter 1, 2, or 3.")
-            except ValueError:
-                print("Please enter a valid number.")
+        crop_choice = _prompt_choice("Enter choice (1-3): ", (1, 2, 3), "Please enter 1, 2, or 3.")
         
         video_crop = None
         if crop_choice == 2:
@@ -1227,48 +1732,25 @@ def get_source_vs_encode_config():
     
     # Get source video
     print("--- Primary Source Video ---")
-    while True:
-        source_path = input("Enter path to primary source video: ").strip('"')
-        if os.path.exists(source_path):
-            break
-        else:
-            print(f"File not found: {source_path}. Please try again.")
+    source_path = _prompt_existing_path("Enter path to primary source video: ")
     
     source_name = input("Enter display name for primary source (default: Source): ").strip() or "Source"
     
     # Get encode video
     print("\n--- Encoded Video ---")
-    while True:
-        encode_path = input("Enter path to encoded video: ").strip('"')
-        if os.path.exists(encode_path):
-            break
-        else:
-            print(f"File not found: {encode_path}. Please try again.")
+    encode_path = _prompt_existing_path("Enter path to encoded video: ")
     
     encode_name = input("Enter display name for encode (default: Encode): ").strip() or "Encode"
     
     # Ask for additional source videos
     print("\n--- Additional Source Videos ---")
     print("You can compare multiple sources with the encoded video")
-    while True:
-        try:
-            num_additional = int(input("How many additional source videos to compare? (0-8): "))
-            if 0 <= num_additional <= 8:
-                break
-            else:
-                print("Please enter a number between 0 and 8.")
-        except ValueError:
-            print("Please enter a valid number.")
+    num_additional = _prompt_choice("How many additional source videos to compare? (0-8): ", range(0, 9), "Please enter a number between 0 and 8.")
     
     additional_sources = []
     for i in range(num_additional):
         print(f"\n--- Additional Source {i+1} ---")
-        while True:
-            additional_path = input(f"Enter path to additional source {i+1}: ").strip('"')
-            if os.path.exists(additional_path):
-                break
-            else:
-                print(f"File not found: {additional_path}. Please try again.")
+        additional_path = _prompt_existing_path(f"Enter path to additional source {i+1}: ")
         
         default_name = f"Source{i+2}"
         additional_name = input(f"Enter display name for additional source {i+1} (default: {default_name}): ").strip() or default_name
@@ -1280,15 +1762,7 @@ def get_source_vs_encode_config():
         print("2. Auto-detect crop (recommended)")
         print("3. Manual crop values")
         
-        while True:
-            try:
-                crop_choice = int(input("Enter choice (1-3): "))
-                if crop_choice in [1, 2, 3]:
-                    break
-                else:
-                    print("Please enter 1, 2, or 3.")
-            except ValueError:
-                print("Please enter a valid number.")
+        crop_choice = _prompt_choice("Enter choice (1-3): ", (1, 2, 3), "Please enter 1, 2, or 3.")
         
         additional_crop = None
         if crop_choice == 2:
@@ -1321,15 +1795,7 @@ def get_source_vs_encode_config():
         print("3. Add padding only") 
         print("4. Both trim and pad")
         
-        while True:
-            try:
-                additional_process_choice = int(input("Choose processing option (1-4): "))
-                if additional_process_choice in [1, 2, 3, 4]:
-                    break
-                else:
-                    print("Please enter 1, 2, 3, or 4.")
-            except ValueError:
-                print("Please enter a valid number.")
+        additional_process_choice = _prompt_choice("Choose processing option (1-4): ", (1, 2, 3, 4), "Please enter 1, 2, 3, or 4.")
         
         additional_trim_start = additional_trim_end = additional_pad_start = additional_pad_end = 0
         
@@ -1382,15 +1848,7 @@ def get_source_vs_encode_config():
     print("2. Auto-detect crop (recommended)")
     print("3. Manual crop values")
     
-    while True:
-        try:
-            crop_choice = int(input("Enter choice (1-3): "))
-            if crop_choice in [1, 2, 3]:
-                break
-            else:
-                print("Please enter 1, 2, or 3.")
-        except ValueError:
-            print("Please enter a valid number.")
+    crop_choice = _prompt_choice("Enter choice (1-3): ", (1, 2, 3), "Please enter 1, 2, or 3.")
     
     source_crop = None
     if crop_choice == 2:
@@ -1427,15 +1885,7 @@ def get_source_vs_encode_config():
     print("3. Add padding only") 
     print("4. Both trim and pad")
     
-    while True:
-        try:
-            source_process_choice = int(input("Choose processing option for source (1-4): "))
-            if source_process_choice in [1, 2, 3, 4]:
-                break
-            else:
-                print("Please enter 1, 2, 3, or 4.")
-        except ValueError:
-            print("Please enter a valid number.")
+    source_process_choice = _prompt_choice("Choose processing option for source (1-4): ", (1, 2, 3, 4), "Please enter 1, 2, 3, or 4.")
     
     if source_process_choice in [2, 4]:  # Trim frames
         print(f"Trimming options for source {source_name}:")
@@ -1462,15 +1912,7 @@ def get_source_vs_encode_config():
     print("3. Add padding only") 
     print("4. Both trim and pad")
     
-    while True:
-        try:
-            encode_process_choice = int(input("Choose processing option for encode (1-4): "))
-            if encode_process_choice in [1, 2, 3, 4]:
-                break
-            else:
-                print("Please enter 1, 2, 3, or 4.")
-        except ValueError:
-            print("Please enter a valid number.")
+    encode_process_choice = _prompt_choice("Choose processing option for encode (1-4): ", (1, 2, 3, 4), "Please enter 1, 2, 3, or 4.")
     
     if encode_process_choice in [2, 4]:  # Trim frames
         print(f"Trimming options for encode {encode_name}:")
@@ -1536,15 +1978,19 @@ def get_source_vs_encode_config():
             'is_source': True
         })
     
-    # Apply resize settings to source videos
-    if resize_config['resize_method'] != 'none':
+    # Apply resize settings to source videos (the method is fixed for the whole call)
+    resize_method = resize_config['resize_method']
+    if resize_method == 'individual':
+        get_resize = resize_config.get('individual_resizes', {}).get
+    elif resize_method == 'common':
+        common_resolution = resize_config.get('common_resolution')
+        get_resize = lambda name: common_resolution
+    else:
+        get_resize = None
+    if get_resize is not None:
         for video in videos:
             if video['is_source']:
-                if resize_config['resize_method'] == 'individual':
-                    if video['name'] in resize_config.get('individual_resizes', {}):
-                        video['resize'] = resize_config['individual_resizes'][video['name']]
-                elif resize_config['resize_method'] == 'common':
-                    video['resize'] = resize_config.get('common_resolution')
+                video['resize'] = get_resize(video['name'])
     
     # Video preview option
     print("\n--- Video Preview (Optional) ---")
@@ -1574,6 +2020,11 @@ def get_source_vs_encode_config():
         **screenshot_config
     }
 
+def _trim_pad_settings(video_config) -> Tuple[int, int, int, int]:
+    """Return a video config's (trim_start, trim_end, pad_start, pad_end), defaulting missing values to 0"""
+    return (video_config.get('trim_start', 0), video_config.get('trim_end', 0),
+            video_config.get('pad_start', 0), video_config.get('pad_end', 0))
+
 def adjust_preview_frames_for_processing(preview_frames, video_configs):
     """
     Adjust preview frame numbers to account for trimming and padding operations.
@@ -1598,41 +2049,36 @@ def adjust_preview_frames_for_processing(preview_frames, video_configs):
     # Get processing settings from the first video config
     # In most cases, all videos will have similar or identical processing
     first_video = video_configs[0]
-    trim_start = first_video.get('trim_start', 0)
-    trim_end = first_video.get('trim_end', 0)
-    pad_start = first_video.get('pad_start', 0)
-    pad_end = first_video.get('pad_end', 0)
+    trim_start, trim_end, pad_start, pad_end = _trim_pad_settings(first_video)
     
     # If no processing is applied, return original frames
     if trim_start == 0 and trim_end == 0 and pad_start == 0 and pad_end == 0:
         return preview_frames
     
-    adjusted_frames = []
-    
     colored_print(f"[ADJUST] Adjusting preview frames for processing:", Colors.YELLOW)
     colored_print(f"[ADJUST] trim_start={trim_start}, trim_end={trim_end}, pad_start={pad_start}, pad_end={pad_end}", Colors.WHITE)
     
-    for original_frame in preview_frames:
-        # Calculate the adjusted frame number
-        # Step 1: Account for trimming from start
-        if original_frame < trim_start:
-            # This frame was trimmed away, skip it
-            colored_print(f"[ADJUST] Frame {original_frame} was trimmed (< trim_start={trim_start}), skipping", Colors.YELLOW)
-            continue
-            
-        adjusted_frame = original_frame - trim_start
-        
-        # Step 2: Account for padding at start  
-        adjusted_frame = adjusted_frame + pad_start
-        
-        # Validate the adjusted frame is reasonable
-        if adjusted_frame >= 0:
-            adjusted_frames.append(adjusted_frame)
-            if len(adjusted_frames) <= 5:  # Show details for first few frames
-                colored_print(f"[ADJUST] Frame {original_frame} → {adjusted_frame}", Colors.CYAN)
-        else:
-            colored_print(f"[ADJUST] Frame {original_frame} resulted in negative frame {adjusted_frame}, skipping", Colors.RED)
-    
+    # Map all frames at once: drop frames trimmed from the start, shift by the trim and padding,
+    # then drop anything that would land before frame 0
+    original = np.asarray(preview_frames, dtype=np.int64)
+    kept = original[original >= trim_start]
+    trimmed_count = len(original) - len(kept)
+    if trimmed_count:
+        colored_print(f"[ADJUST] {trimmed_count} frame(s) were trimmed (< trim_start={trim_start}), skipping", Colors.YELLOW)
+    
+    adjusted = kept - trim_start + pad_start
+    valid = adjusted >= 0
+    if not valid.all():
+        colored_print(f"[ADJUST] {int((~valid).sum())} frame(s) resulted in negative frame numbers, skipping", Colors.RED)
+    kept, adjusted = kept[valid], adjusted[valid]
+    
+    # Show details for first few frames in a single write
+    if len(kept):
+        sample_map = "\n".join(f"[ADJUST] Frame {original_frame} → {adjusted_frame}"
+                               for original_frame, adjusted_frame in zip(kept[:5].tolist(), adjusted[:5].tolist()))
+        colored_print(sample_map, Colors.CYAN)
+    
+    adjusted_frames = adjusted.tolist()
     if len(adjusted_frames) != len(preview_frames):
         colored_print(f"[ADJUST] {len(preview_frames) - len(adjusted_frames)} frames were excluded due to trimming", Colors.YELLOW)
     
@@ -1646,12 +2092,13 @@ def get_screenshot_and_upload_config(videos=None):
     """Get screenshot options and upload configuration"""
     print("\n--- Screenshot Options ---")
     
-    # Check if any video has preview-selected frames
-    preview_frames = []
+    # Check if any video has preview-selected frames (deduplicated while collecting)
+    preview_frame_set = set()
     if videos:
         for video in videos:
             if 'preview_selected_frames' in video and video['preview_selected_frames']:
-                preview_frames.extend(video['preview_selected_frames'])
+                preview_frame_set.update(video['preview_selected_frames'])
+    preview_frames = sorted(preview_frame_set)
     
     if preview_frames:
         # Adjust preview frames for trimming/padding operations
@@ -1660,29 +2107,21 @@ def get_screenshot_and_upload_config(videos=None):
         # Check if all videos have the same processing settings
         if len(videos) > 1:
             first_video = videos[0]
-            consistent_processing = True
-            for video in videos[1:]:
-                if (video.get('trim_start', 0) != first_video.get('trim_start', 0) or
-                    video.get('trim_end', 0) != first_video.get('trim_end', 0) or
-                    video.get('pad_start', 0) != first_video.get('pad_start', 0) or
-                    video.get('pad_end', 0) != first_video.get('pad_end', 0)):
-                    consistent_processing = False
-                    break
+            consistent_processing = len({_trim_pad_settings(video) for video in videos}) == 1
             
             if not consistent_processing:
                 colored_print(f"[WARN] Videos have different trim/pad settings!", Colors.YELLOW, bold=True)
                 colored_print(f"[WARN] Frame adjustment based on first video: {first_video['name']}", Colors.YELLOW)
                 colored_print(f"[WARN] Preview frames may not align perfectly with other videos", Colors.YELLOW)
         
-        # Remove duplicates and sort
-        adjusted_preview_frames = sorted(list(set(adjusted_preview_frames)))
+        # Already sorted and unique: the input frames are, and the trim/pad shift preserves that
         colored_print(f"[PREVIEW] Using {len(adjusted_preview_frames)} frames selected from preview!", Colors.GREEN, bold=True)
         
         # Show frame mapping summary if frames were adjusted
-        first_video = videos[0]
-        if (first_video.get('trim_start', 0) > 0 or first_video.get('pad_start', 0) > 0):
+        first_trim_start, _, first_pad_start, _ = _trim_pad_settings(videos[0])
+        if first_trim_start > 0 or first_pad_start > 0:
             colored_print(f"[MAPPING] Preview frame adjustment summary:", Colors.BLUE, bold=True)
-            sample_original = sorted(list(set(preview_frames)))[:5]
+            sample_original = preview_frames[:5]
             sample_adjusted = adjusted_preview_frames[:5]
             for i, (orig, adj) in enumerate(zip(sample_original, sample_adjusted)):
                 colored_print(f"[MAPPING]   Preview frame {orig + 1} → Processed frame {adj + 1}", Colors.CYAN)
@@ -1700,15 +2139,7 @@ def get_screenshot_and_upload_config(videos=None):
         print("1. Use frame interval (e.g., every 150 frames)")
         print("2. Specify custom frame numbers")
         
-        while True:
-            try:
-                choice = int(input("Enter choice (1 or 2): "))
-                if choice in [1, 2]:
-                    break
-                else:
-                    print("Please enter 1 or 2.")
-            except ValueError:
-                print("Please enter a valid number.")
+        choice = _prompt_choice("Enter choice (1 or 2): ", (1, 2), "Please enter 1 or 2.")
         
         if choice == 1:
             # Frame interval
@@ -1739,15 +2170,7 @@ def get_screenshot_and_upload_config(videos=None):
     print("1. Yes, upload to slow.pics")
     print("2. No, save locally only")
     
-    while True:
-        try:
-            upload_choice = int(input("Enter choice (1 or 2): "))
-            if upload_choice in [1, 2]:
-                break
-            else:
-                print("Please enter 1 or 2.")
-        except ValueError:
-            print("Please enter a valid number.")
+    upload_choice = _prompt_choice("Enter choice (1 or 2): ", (1, 2), "Please enter 1 or 2.")
     
     upload_to_slowpics = upload_choice == 1
     show_name = ""
@@ -1765,15 +2188,7 @@ def get_screenshot_and_upload_config(videos=None):
             print("1. Yes (TV series)")
             print("2. No (Movie)")
             
-            while True:
-                try:
-                    series_choice = int(input("Enter choice (1 or 2): "))
-                    if series_choice in [1, 2]:
-                        break
-                    else:
-                        print("Please enter 1 or 2.")
-                except ValueError:
-                    print("Please enter a valid number.")
+            series_choice = _prompt_choice("Enter choice (1 or 2): ", (1, 2), "Please enter 1 or 2.")
             
             if series_choice == 1:
                 season_input = input("Enter season number (e.g., 1, 2, 3): ").strip()
@@ -1787,24 +2202,16 @@ def get_screenshot_and_upload_config(videos=None):
                         print("1. Full season/season pack")
                         print("2. Single episode")
                         
-                        while True:
-                            try:
-                                episode_choice = int(input("Enter choice (1 or 2): "))
-                                if episode_choice in [1, 2]:
-                                    if episode_choice == 2:
-                                        episode_input = input("Enter episode number (e.g., 1, 2, 15): ").strip()
-                                        if episode_input:
-                                            try:
-                                                episode_num = int(episode_input)
-                                                episode_number = f"E{episode_num:02d}"
-                                            except ValueError:
-                                                print("Invalid episode number, continuing without episode.")
-                                                episode_number = ""
-                                    break
-                                else:
-                                    print("Please enter 1 or 2.")
-                            except ValueError:
-                                print("Please enter a valid number.")
+                        episode_choice = _prompt_choice("Enter choice (1 or 2): ", (1, 2), "Please enter 1 or 2.")
+                        if episode_choice == 2:
+                            episode_input = input("Enter episode number (e.g., 1, 2, 15): ").strip()
+                            if episode_input:
+                                try:
+                                    episode_num = int(episode_input)
+                                    episode_number = f"E{episode_num:02d}"
+                                except ValueError:
+                                    print("Invalid episode number, continuing without episode.")
+                                    episode_number = ""
                                 
                     except ValueError:
                         print("Invalid season number, continuing without season.")
@@ -1819,195 +2226,106 @@ def get_screenshot_and_upload_config(videos=None):
         'episode_number': episode_number
     }
 
-def get_resize_config(videos):
-    """Get resize configuration for video comparison"""
-    print("\n--- Resize Options ---")
-    print("Manual resize configuration for video comparison")
+# ffprobe executable used for resolution probing (None when it isn't on PATH)
+FFPROBE_PATH = shutil.which("ffprobe")
+
+def _probe_resolution(path: str) -> Tuple[int, int]:
+    """Read a video's width and height, reusing the result while the file is unchanged"""
+    return _probe_file_resolution(os.path.abspath(path), os.path.getmtime(path))
+
+@lru_cache(maxsize=256)
+def _probe_file_resolution(path: str, mtime: float) -> Tuple[int, int]:
+    """
+    Read a video's width and height (cached per path and modification time).
     
-    # First, load videos to check their resolutions
-    print("Checking video resolutions...")
-    video_resolutions = []
-    for video in videos:
+    Uses ffprobe when it is installed, which only parses the container headers; opening the
+    clip with the processor can mean indexing the whole file (VapourSynth) or starting a decoder.
+    """
+    if FFPROBE_PATH:
         try:
-            temp_clip = processor.load_video(video['path'])
-            if processor.mode == "vapoursynth":
-                width, height = temp_clip.width, temp_clip.height
-            elif processor.mode == "opencv":
-                width = int(temp_clip.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(temp_clip.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                temp_clip.release()  # Close OpenCV capture
-            else:
-                # For PIL mode, assume standard resolution as fallback
-                width, height = 1920, 1080
-                
-            video_resolutions.append({
-                'name': video['name'],
-                'width': width,
-                'height': height,
-                'path': video['path']
-            })
-            print(f"  {video['name']}: {width}x{height}")
-        except Exception as e:
-            print(f"  Error reading {video['name']}: {e}")
-            video_resolutions.append({
-                'name': video['name'],
-                'width': 1920,
-                'height': 1080,
-                'path': video['path']
-            })
-    
-    print(f"\nChoose resize method:")
-    print("1. No resizing (keep original resolutions)")
-    print("2. Manual resize - specify resolution for each video individually")
-    print("3. Common resolution - resize all videos to the same resolution")
-    
-    while True:
+            result = subprocess.run(
+                [FFPROBE_PATH, "-v", "error", "-select_streams", "v:0",
+                 "-show_entries", "stream=width,height", "-of", "csv=p=0", path],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode == 0:
+                width, height = result.stdout.strip().splitlines()[0].split(',')[:2]
+                return int(width), int(height)
+        except (OSError, subprocess.SubprocessError, ValueError, IndexError):
+            pass  # Fall back to opening the clip below
+    
+    temp_clip = processor.load_video(path)
+    if processor.mode == "vapoursynth":
+        return temp_clip.width, temp_clip.height
+    elif processor.mode == "opencv":
+        width = int(temp_clip.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(temp_clip.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        temp_clip.release()  # Close OpenCV capture
+        return width, height
+    # For PIL mode, assume standard resolution as fallback
+    return 1920, 1080
+
+def _read_video_resolutions(videos) -> List[Dict[str, Any]]:
+    """Probe every video's resolution concurrently and report them in the original order"""
+    def probe(video):
         try:
-            resize_choice = int(input("Enter choice (1-3): "))
-            if resize_choice in [1, 2, 3]:
-                break
-            else:
-                print("Please enter 1, 2, or 3.")
-        except ValueError:
-            print("Please enter a valid number.")
-    
-    resize_method = 'none'
-    individual_resizes = {}
-    common_resolution = None
-    
-    if resize_choice == 1:
-        resize_method = 'none'
-        print("No resizing will be applied")
-    
-    elif resize_choice == 2:
-        resize_method = 'individual'
-        print("\nManual resize for each video:")
-        print("Enter new resolution for each video (leave blank to keep original):")
-        
-        for video_res in video_resolutions:
-            print(f"\n{video_res['name']} (current: {video_res['width']}x{video_res['height']}):")
-            width_input = input(f"  New width (default: {video_res['width']}): ").strip()
-            height_input = input(f"  New height (default: {video_res['height']}): ").strip()
-            
-            try:
-                new_width = int(width_input) if width_input else video_res['width']
-                new_height = int(height_input) if height_input else video_res['height']
-                
-                if new_width > 0 and new_height > 0:
-                    if (new_width, new_height) != (video_res['width'], video_res['height']):
-                        individual_resizes[video_res['name']] = (new_width, new_height)
-                        print(f"  Will resize to {new_width}x{new_height}")
-                    else:
-                        print(f"  Keeping original resolution")
-                else:
-                    print(f"  Invalid resolution, keeping original")
-            except ValueError:
-                print(f"  Invalid input, keeping original resolution")
+            return _probe_resolution(video['path']), None
+        except Exception as e:
+            return (1920, 1080), e
     
-    elif resize_choice == 3:
-        resize_method = 'common'
-        print("\nCommon resolution for all videos:")
-        print("Choose preset or enter custom:")
-        print("1. 1080p (1920x1080)")
-        print("2. 1440p (2560x1440)")
-        print("3. 4K (3840x2160)")
-        print("4. 720p (1280x720)")
-        print("5. Custom resolution")
-        
-        while True:
-            try:
-                preset_choice = int(input("Enter choice (1-5): "))
-                if preset_choice in [1, 2, 3, 4, 5]:
-                    break
-                else:
-                    print("Please enter 1, 2, 3, 4, or 5.")
-            except ValueError:
-                print("Please enter a valid number.")
-        
-        if preset_choice == 1:
-            common_resolution = (1920, 1080)
-            print("All videos will be resized to 1920x1080 (1080p)")
-        elif preset_choice == 2:
-            common_resolution = (2560, 1440)
-            print("All videos will be resized to 2560x1440 (1440p)")
-        elif preset_choice == 3:
-            common_resolution = (3840, 2160)
-            print("All videos will be resized to 3840x2160 (4K)")
-        elif preset_choice == 4:
-            common_resolution = (1280, 720)
-            print("All videos will be resized to 1280x720 (720p)")
-        elif preset_choice == 5:
-            print("Enter custom resolution:")
-            try:
-                custom_width = int(input("  Width: "))
-                custom_height = int(input("  Height: "))
-                if custom_width > 0 and custom_height > 0:
-                    common_resolution = (custom_width, custom_height)
-                    print(f"All videos will be resized to {custom_width}x{custom_height}")
-                else:
-                    print("Invalid resolution, no resizing will be applied")
-                    resize_method = 'none'
-            except ValueError:
-                print("Invalid resolution values, no resizing will be applied")
-                resize_method = 'none'
+    # Each probe mostly waits on a subprocess or file I/O, so threads overlap them well
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(videos)))) as executor:
+        results = list(executor.map(probe, videos))
     
-    return {
-        'resize_method': resize_method,
-        'individual_resizes': individual_resizes,
-        'common_resolution': common_resolution,
-        'video_resolutions': video_resolutions
-    }
+    video_resolutions = []
+    for video, ((width, height), error) in zip(videos, results):
+        if error is None:
+            print(f"  {video['name']}: {width}x{height}")
+        else:
+            print(f"  Error reading {video['name']}: {error}")
+        video_resolutions.append({
+            'name': video['name'],
+            'width': width,
+            'height': height,
+            'path': video['path']
+        })
+    return video_resolutions
+
+def get_resize_config(videos):
+    """Get resize configuration for video comparison"""
+    print("\n--- Resize Options ---")
+    print("Manual resize configuration for video comparison")
+    return _resize_config_core(videos, source_only=False)
 
 def get_source_resize_config(source_videos):
     """Get resize configuration for source videos only (encode videos are never resized)"""
     print("Manual resize configuration for source videos only")
+    return _resize_config_core(source_videos, source_only=True)
+
+# Common-resolution presets offered by the resize prompts: menu number -> (width, height, label)
+RESOLUTION_PRESETS = {
+    1: (1920, 1080, "1080p"),
+    2: (2560, 1440, "1440p"),
+    3: (3840, 2160, "4K"),
+    4: (1280, 720, "720p"),
+}
+
+def _resize_config_core(videos, source_only: bool):
+    """Probe resolutions and prompt for a resize method; shared by both comparison types"""
+    # Wording differs only in which videos are being resized
+    videos_label = "source videos" if source_only else "videos"
+    video_label = "source video" if source_only else "video"
     
     # First, load videos to check their resolutions
-    print("Checking source video resolutions...")
-    video_resolutions = []
-    for video in source_videos:
-        try:
-            temp_clip = processor.load_video(video['path'])
-            if processor.mode == "vapoursynth":
-                width, height = temp_clip.width, temp_clip.height
-            elif processor.mode == "opencv":
-                width = int(temp_clip.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(temp_clip.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                temp_clip.release()  # Close OpenCV capture
-            else:
-                # For PIL mode, assume standard resolution as fallback
-                width, height = 1920, 1080
-                
-            video_resolutions.append({
-                'name': video['name'],
-                'width': width,
-                'height': height,
-                'path': video['path']
-            })
-            print(f"  {video['name']}: {width}x{height}")
-        except Exception as e:
-            print(f"  Error reading {video['name']}: {e}")
-            video_resolutions.append({
-                'name': video['name'],
-                'width': 1920,
-                'height': 1080,
-                'path': video['path']
-            })
+    print(f"Checking {video_label} resolutions...")
+    video_resolutions = _read_video_resolutions(videos)
     
-    print(f"\nChoose resize method for source videos:")
+    print(f"\nChoose resize method{' for source videos' if source_only else ''}:")
     print("1. No resizing (keep original resolutions)")
-    print("2. Manual resize - specify resolution for each source video individually")
-    print("3. Common resolution - resize all source videos to the same resolution")
+    print(f"2. Manual resize - specify resolution for each {video_label} individually")
+    print(f"3. Common resolution - resize all {videos_label} to the same resolution")
     
-    while True:
-        try:
-            resize_choice = int(input("Enter choice (1-3): "))
-            if resize_choice in [1, 2, 3]:
-                break
-            else:
-                print("Please enter 1, 2, or 3.")
-        except ValueError:
-            print("Please enter a valid number.")
+    resize_choice = _prompt_choice("Enter choice (1-3): ", (1, 2, 3), "Please enter 1, 2, or 3.")
     
     resize_method = 'none'
     individual_resizes = {}
@@ -2015,12 +2333,12 @@ def get_source_resize_config(source_videos):
     
     if resize_choice == 1:
         resize_method = 'none'
-        print("No resizing will be applied to source videos")
+        print(f"No resizing will be applied{' to source videos' if source_only else ''}")
     
     elif resize_choice == 2:
         resize_method = 'individual'
-        print("\nManual resize for each source video:")
-        print("Enter new resolution for each source video (leave blank to keep original):")
+        print(f"\nManual resize for each {video_label}:")
+        print(f"Enter new resolution for each {video_label} (leave blank to keep original):")
         
         for video_res in video_resolutions:
             print(f"\n{video_res['name']} (current: {video_res['width']}x{video_res['height']}):")
@@ -2044,44 +2362,26 @@ def get_source_resize_config(source_videos):
     
     elif resize_choice == 3:
         resize_method = 'common'
-        print("\nCommon resolution for all source videos:")
+        print(f"\nCommon resolution for all {videos_label}:")
         print("Choose preset or enter custom:")
-        print("1. 1080p (1920x1080)")
-        print("2. 1440p (2560x1440)")
-        print("3. 4K (3840x2160)")
-        print("4. 720p (1280x720)")
+        for number, (width, height, label) in RESOLUTION_PRESETS.items():
+            print(f"{number}. {label} ({width}x{height})")
         print("5. Custom resolution")
         
-        while True:
-            try:
-                preset_choice = int(input("Enter choice (1-5): "))
-                if preset_choice in [1, 2, 3, 4, 5]:
-                    break
-                else:
-                    print("Please enter 1, 2, 3, 4, or 5.")
-            except ValueError:
-                print("Please enter a valid number.")
-        
-        if preset_choice == 1:
-            common_resolution = (1920, 1080)
-            print("All source videos will be resized to 1920x1080 (1080p)")
-        elif preset_choice == 2:
-            common_resolution = (2560, 1440)
-            print("All source videos will be resized to 2560x1440 (1440p)")
-        elif preset_choice == 3:
-            common_resolution = (3840, 2160)
-            print("All source videos will be resized to 3840x2160 (4K)")
-        elif preset_choice == 4:
-            common_resolution = (1280, 720)
-            print("All source videos will be resized to 1280x720 (720p)")
-        elif preset_choice == 5:
+        preset_choice = _prompt_choice("Enter choice (1-5): ", (1, 2, 3, 4, 5), "Please enter 1, 2, 3, 4, or 5.")
+        
+        if preset_choice in RESOLUTION_PRESETS:
+            width, height, label = RESOLUTION_PRESETS[preset_choice]
+            common_resolution = (width, height)
+            print(f"All {videos_label} will be resized to {width}x{height} ({label})")
+        else:
             print("Enter custom resolution:")
             try:
                 custom_width = int(input("  Width: "))
                 custom_height = int(input("  Height: "))
                 if custom_width > 0 and custom_height > 0:
                     common_resolution = (custom_width, custom_height)
-                    print(f"All source videos will be resized to {custom_width}x{custom_height}")
+                    print(f"All {videos_label} will be resized to {custom_width}x{custom_height}")
                 else:
                     print("Invalid resolution, no resizing will be applied")
                     resize_method = 'none'
@@ -2096,6 +2396,28 @@ def get_source_resize_config(source_videos):
         'video_resolutions': video_resolutions
     }
 
+def _resize_crop(clip, width, height, left, right, top, bottom):
+    """
+    Resize to width x height and crop the result, in a single resize pass.
+    
+    The crop is given at the target resolution and mapped back onto the source, so the
+    resampler only produces the kept window instead of a full frame that is then cut down.
+    """
+    return _resize_clip(clip, **_resize_crop_params(clip.width, clip.height, width, height, left, right, top, bottom))
+
+@lru_cache(maxsize=64)
+def _resize_crop_params(src_width, src_height, width, height, left, right, top, bottom):
+    """Resize keyword arguments for _resize_crop; sources sharing a resolution and crop reuse them (read-only)"""
+    scale_x = src_width / width
+    scale_y = src_height / height
+    out_width = width - left - right
+    out_height = height - top - bottom
+    return {
+        'width': out_width, 'height': out_height,
+        'src_left': left * scale_x, 'src_top': top * scale_y,
+        'src_width': out_width * scale_x, 'src_height': out_height * scale_y,
+    }
+
 def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, crop=None, resize=None, is_source=False):
     """Apply trimming, padding, cropping, and resizing to a video clip (VapourSynth only)"""
     
@@ -2110,21 +2432,29 @@ def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, cro
         # SOURCE: Resize first, then crop at target resolution
         # This prevents scaling crop values - 140px always means 140px regardless of source resolution
         
-        # Apply resizing first for source videos
+        # Apply resizing first for source videos. The resize itself is deferred so a manual
+        # crop can be folded into the same resize call (see _resize_crop)
+        pending_resize = None
         if resize and resize != (clip.width, clip.height):
             target_width, target_height = resize
-            colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{target_height} using Spline36", Colors.YELLOW)
-            clip = core.resize.Spline36(clip, width=target_width, height=target_height)
+            colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{target_height} using {RESIZE_KERNEL}", Colors.YELLOW)
+            pending_resize = resize
+        width, height = pending_resize or (clip.width, clip.height)
         
         # Apply cropping after resizing for source videos (crop values at target resolution)
         if crop:
             if crop == "auto":
                 # Auto-detect crop using cropdetect
                 colored_print(f"  [INFO] Auto-detecting crop for better comparison...", Colors.CYAN)
+                if pending_resize:
+                    # Crop detection has to look at the resized frames
+                    clip = _resize_clip(clip, width=width, height=height)
+                    pending_resize = None
                 try:
                     # Use awsmfunc for auto crop detection if available
-                    if awf and hasattr(awf, 'CropResize'):
-                        clip = awf.CropResize(clip, width=clip.width, height=clip.height)
+                    awsmfunc = get_awsmfunc()
+                    if awsmfunc and hasattr(awsmfunc, 'CropResize'):
+                        clip = awsmfunc.CropResize(clip, width=clip.width, height=clip.height)
                         colored_print(f"  [OK] Applied auto-crop", Colors.GREEN)
                     else:
                         # Fallback to manual crop detection
@@ -2143,24 +2473,28 @@ def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, cro
                 bottom = crop.get('bottom', 0)
                 
                 if left or right or top or bottom:
-                    new_width = clip.width - left - right
-                    new_height = clip.height - top - bottom
+                    new_width = width - left - right
+                    new_height = height - top - bottom
                     
                     # Validate crop values
                     if new_width <= 0 or new_height <= 0:
                         colored_print(f"  [ERROR] Invalid crop values would result in {new_width}x{new_height}", Colors.RED)
-                        colored_print(f"  [ERROR] Current: {clip.width}x{clip.height}, Crop: L={left}, R={right}, T={top}, B={bottom}", Colors.RED)
+                        colored_print(f"  [ERROR] Current: {width}x{height}, Crop: L={left}, R={right}, T={top}, B={bottom}", Colors.RED)
                         colored_print(f"  [ERROR] Skipping crop to prevent errors", Colors.RED)
-                    elif new_width < 100 or new_height < 100:
-                        colored_print(f"  [WARN] Crop results in very small resolution: {new_width}x{new_height}", Colors.YELLOW)
-                        colored_print(f"  [WARN] This may not be intended - please verify crop values", Colors.YELLOW)
-                        clip = core.std.Crop(clip, left=left, right=right, top=top, bottom=bottom)
-                        colored_print(f"  [?[CROP] Applied crop: left={left}, right={right}, top={top}, bottom={bottom}", Colors.CYAN)
-                        colored_print(f"  [?[RES] New resolution after crop: {new_width}x{new_height}", Colors.GREEN)
                     else:
-                        clip = core.std.Crop(clip, left=left, right=right, top=top, bottom=bottom)
+                        if new_width < 100 or new_height < 100:
+                            colored_print(f"  [WARN] Crop results in very small resolution: {new_width}x{new_height}", Colors.YELLOW)
+                            colored_print(f"  [WARN] This may not be intended - please verify crop values", Colors.YELLOW)
+                        if pending_resize:
+                            clip = _resize_crop(clip, width, height, left, right, top, bottom)
+                            pending_resize = None
+                        else:
+                            clip = core.std.Crop(clip, left=left, right=right, top=top, bottom=bottom)
                         colored_print(f"  [?[CROP] Applied crop: left={left}, right={right}, top={top}, bottom={bottom}", Colors.CYAN)
                         colored_print(f"  [?[RES] New resolution after crop: {new_width}x{new_height}", Colors.GREEN)
+        
+        if pending_resize:
+            clip = _resize_clip(clip, width=width, height=height)
     else:
         # ENCODE: Crop first (if any), then resize
         # Apply cropping first for encode videos (unusual but possible)
@@ -2168,8 +2502,9 @@ def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, cro
             if crop == "auto":
                 colored_print(f"  [INFO] Auto-detecting crop...", Colors.CYAN)
                 try:
-                    if awf and hasattr(awf, 'CropResize'):
-                        clip = awf.CropResize(clip, width=clip.width, height=clip.height)
+                    awsmfunc = get_awsmfunc()
+                    if awsmfunc and hasattr(awsmfunc, 'CropResize'):
+                        clip = awsmfunc.CropResize(clip, width=clip.width, height=clip.height)
                         colored_print(f"  [OK] Applied auto-crop", Colors.GREEN)
                     else:
                         colored_print(f"  [WARN] Auto-crop not available, continuing without crop", Colors.YELLOW)
@@ -2210,8 +2545,8 @@ def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, cro
                 colored_print(f"  [?[KEEP] Keeping original encode resolution: {clip.width}x{clip.height}", Colors.CYAN)
             else:
                 target_width, target_height = resize
-                colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{target_height} using Spline36", Colors.YELLOW)
-                clip = core.resize.Spline36(clip, width=target_width, height=target_height)
+                colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{target_height} using {RESIZE_KERNEL}", Colors.YELLOW)
+                clip = _resize_clip(clip, width=target_width, height=target_height)
     
     # Apply trimming
     if trim_start > 0 or trim_end > 0:
@@ -2219,67 +2554,54 @@ def apply_processing(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, cro
         clip = clip[trim_start:end_frame]
         colored_print(f"  [?[TRIM] Applied trim: start={trim_start}, end={trim_end}", Colors.BLUE)
     
-    # Apply padding
-    if pad_start > 0:
-        blank_start = core.std.BlankClip(clip, length=pad_start)
-        clip = blank_start + clip
-        colored_print(f"  [?] Added {pad_start} blank frames at start", Colors.BLUE)
-    
-    if pad_end > 0:
-        blank_end = core.std.BlankClip(clip, length=pad_end)
-        clip = clip + blank_end
-        colored_print(f"  [?] Added {pad_end} blank frames at end", Colors.BLUE)
+    # Apply padding - joined with one Splice node instead of a chain of "+" splices,
+    # sharing the blank clip when both ends get the same amount
+    if pad_start > 0 or pad_end > 0:
+        segments = [clip]
+        if pad_start > 0:
+            blank_start = core.std.BlankClip(clip, length=pad_start)
+            segments.insert(0, blank_start)
+            colored_print(f"  [?] Added {pad_start} blank frames at start", Colors.BLUE)
+        if pad_end > 0:
+            blank_end = blank_start if pad_end == pad_start else core.std.BlankClip(clip, length=pad_end)
+            segments.append(blank_end)
+            colored_print(f"  [?] Added {pad_end} blank frames at end", Colors.BLUE)
+        clip = core.std.Splice(segments)
     
     return clip
 
-# ROLLBACK OPTION: If resize-first approach doesn't work well, uncomment the code below
-# and comment out the current apply_processing function above
-
-"""
-# ROLLBACK: Original crop-first approach for sources
-def apply_processing_crop_first(clip, trim_start=0, trim_end=0, pad_start=0, pad_end=0, crop=None, resize=None, is_source=False):
-    # For source videos: Apply cropping first (at original resolution), then resizing
-    # For encode videos: Apply cropping first (if any), then resizing
-    
-    if is_source:
-        # SOURCE: Crop first at original resolution, then resize
-        # This ensures proper letterbox/pillarbox removal before scaling
-        
-        # Apply cropping first for source videos to remove letterbox/pillarbox
-        if crop and isinstance(crop, dict):
-            left = crop.get('left', 0)
-            right = crop.get('right', 0)
-            top = crop.get('top', 0)
-            bottom = crop.get('bottom', 0)
-            
-            if left or right or top or bottom:
-                new_width = clip.width - left - right
-                new_height = clip.height - top - bottom
-                
-                if new_width > 0 and new_height > 0:
-                    clip = core.std.Crop(clip, left=left, right=right, top=top, bottom=bottom)
-                    colored_print(f"  [?[CROP] Applied crop: left={left}, right={right}, top={top}, bottom={bottom}", Colors.CYAN)
-                    colored_print(f"  [?[RES] New resolution after crop: {new_width}x{new_height}", Colors.GREEN)
-        
-        # Apply resizing after cropping for source videos with aspect ratio adjustment
-        if resize and resize != (clip.width, clip.height):
-            target_width, target_height = resize
-            
-            # For source videos with cropping: adjust resize target to maintain aspect ratio after crop
-            if crop and isinstance(crop, dict):
-                cropped_aspect_ratio = clip.width / clip.height
-                calculated_height = int(target_width / cropped_aspect_ratio)
-                colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{calculated_height} (aspect-ratio-aware)", Colors.YELLOW)
-                clip = core.resize.Spline36(clip, width=target_width, height=calculated_height)
-            else:
-                colored_print(f"  [TOOL] Resizing from {clip.width}x{clip.height} to {target_width}x{target_height} using Spline36", Colors.YELLOW)
-                clip = core.resize.Spline36(clip, width=target_width, height=target_height)
+def _upload_progress_printer(total_images: int):
+    """Return a function that rewrites the upload progress line for a number of uploaded images"""
+    # Style and total are baked into the template once, so each tick is a single format + write
+    template = colorize(f"[REFRESH] Progress: {{}}/{total_images} images uploaded ({{:.1f}}%)", Colors.BLUE) + '\r'
+    percent_per_image = 100 / total_images if total_images else 100.0
     
-    # Apply trimming and padding as usual
-    # ... rest of function ...
+    def print_progress(uploaded):
+        out = sys.stdout  # Looked up per tick: it may be redirected, or None in windowed builds
+        if out is not None:
+            out.write(template.format(uploaded, uploaded * percent_per_image))
     
-    return clip
-"""
+    return print_progress
+
+def _open_in_browser(url: str) -> bool:
+    """Open a URL in the default browser; returns False when there is no desktop session to open it in"""
+    # Without a display, webbrowser falls back to console browsers (lynx, w3m) that take over the terminal
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        return False
+    import webbrowser  # Only loaded when a browser can actually be launched
+    return webbrowser.open(url)
+
+def _total_screenshot_bytes(frames, processed_videos) -> int:
+    """Size on disk of the screenshots for these frames (0 when none can be found)"""
+    wanted = set(frames)
+    total = 0
+    for video in processed_videos:
+        try:
+            index = _index_screenshots(os.path.join("Screenshots", video['name']), video['name'])
+        except FileNotFoundError:
+            continue
+        total += sum(os.path.getsize(path) for frame, path in index.items() if frame in wanted)
+    return total
 
 def upload_to_slowpics(config, frames, processed_videos):
     """
@@ -2314,8 +2636,12 @@ def upload_to_slowpics(config, frames, processed_videos):
     # Fallback: Split into 3-5 large chunks
     colored_print(f"[FALLBACK] Splitting into 3-5 large comparisons...", Colors.MAGENTA, bold=True)
     
-    # Calculate chunk size to get 3-5 comparisons
-    target_comparisons = min(5, max(3, total_images // 400))  # Aim for ~400 images per comparison, but keep it 3-5
+    # Calculate chunk size to get 3-5 comparisons, sized by bytes since a 4K PNG can be 20x a 720p one
+    total_bytes = _total_screenshot_bytes(frames, processed_videos)
+    if total_bytes:
+        target_comparisons = min(5, max(3, math.ceil(total_bytes / SLOWPICS_CHUNK_TARGET_BYTES)))
+    else:
+        target_comparisons = min(5, max(3, total_images // 400))  # Aim for ~400 images per comparison, but keep it 3-5
     frames_per_chunk = len(frames) // target_comparisons
     if frames_per_chunk < 1:
         frames_per_chunk = 1
@@ -2364,8 +2690,8 @@ def upload_to_slowpics(config, frames, processed_videos):
     # Open the first comparison in browser
     if all_urls:
         try:
-            webbrowser.open(all_urls[0])
-            colored_print("[START] Opening first comparison in your default browser...", Colors.GREEN, bold=True)
+            if _open_in_browser(all_urls[0]):
+                colored_print("[START] Opening first comparison in your default browser...", Colors.GREEN, bold=True)
         except Exception as e:
             colored_print(f"[WARN] Could not open browser: {e}", Colors.YELLOW)
     
@@ -2376,31 +2702,6 @@ def _upload_single_comparison(config, frames, processed_videos, title_suffix="")
     """
     Upload a single comparison to slow.pics.
     """
-    import time  # Import here to ensure it's available throughout the function
-    
-    # Generate collection name
-    source_names = [video['name'] for video in processed_videos]
-    vs_string = " vs ".join(source_names)
-    
-    # Build collection name with season and episode info
-    title_parts = [config['show_name']]
-    if config.get('season_number'):
-        season_episode = config['season_number']
-        if config.get('episode_number'):
-            season_episode += config['episode_number']
-        title_parts.append(season_episode)
-    title_parts.append(vs_string)
-    
-    collection_name = " ".join(title_parts) + title_suffix
-    colored_print(f"[?[NAME] Collection name: {collection_name}", Colors.CYAN, bold=True)
-
-
-def _upload_single_comparison(config, frames, processed_videos, title_suffix=""):
-    """
-    Upload a single comparison to slow.pics.
-    """
-    import time  # Import here to ensure it's available throughout the function
-    
     # Generate collection name
     source_names = [video['name'] for video in processed_videos]
     vs_string = " vs ".join(source_names)
@@ -2423,38 +2724,40 @@ def _upload_single_comparison(config, frames, processed_videos, title_suffix="")
         
         # Get all image files organized by frame number
         base_screenshots_folder = "Screenshots"
-        all_image_files = []
+        source_folders = {video['name']: os.path.join(base_screenshots_folder, video['name'])
+                          for video in processed_videos}
         
-        # Collect all PNG files from all source folders
-        for video in processed_videos:
-            source_folder = os.path.join(base_screenshots_folder, video['name'])
-            if os.path.exists(source_folder):
-                png_files = [f for f in os.listdir(source_folder) if f.endswith('.png')]
-                for png_file in png_files:
-                    full_path = os.path.join(source_folder, png_file)
-                    all_image_files.append(full_path)
+        def index_source_folder(name):
+            """Index one source folder: {frame number: screenshot path}"""
+            try:
+                return _index_screenshots(source_folders[name], name)
+            except FileNotFoundError:
+                return {}
         
-        # Sort files to ensure consistent ordering
-        all_image_files.sort()
+        def index_source_folders():
+            """Index every source folder once: {source name: {frame number: screenshot path}}"""
+            # scandir releases the GIL, so slow disks and network shares are listed concurrently
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(source_folders)))) as executor:
+                return dict(zip(source_folders, executor.map(index_source_folder, source_folders)))
+        
+        # The same scan serves both the count check here and the path lookups during upload
+        folder_indexes = index_source_folders()
+        found_images = sum(map(len, folder_indexes.values()))
         
         # Verify we have the expected number of images
         expected_images = len(frames) * len(processed_videos)
-        if len(all_image_files) < expected_images:
-            print(f"Warning: Expected {expected_images} images but found {len(all_image_files)}")
-            # Wait a bit and check again
-            time.sleep(2)
-            all_image_files = []
-            for video in processed_videos:
-                source_folder = os.path.join(base_screenshots_folder, video['name'])
-                if os.path.exists(source_folder):
-                    png_files = [f for f in os.listdir(source_folder) if f.endswith('.png')]
-                    for png_file in png_files:
-                        full_path = os.path.join(source_folder, png_file)
-                        all_image_files.append(full_path)
-            all_image_files.sort()
+        if found_images < expected_images:
+            print(f"Warning: Expected {expected_images} images but found {found_images}")
+            # Files may still be flushing to disk - poll again with exponential backoff
+            for delay in _IMAGE_RESCAN_DELAYS:
+                time.sleep(delay)
+                folder_indexes = index_source_folders()
+                found_images = sum(map(len, folder_indexes.values()))
+                if found_images >= expected_images:
+                    break
             
-            if len(all_image_files) < expected_images:
-                raise Exception(f"Missing image files. Expected {expected_images}, found {len(all_image_files)}")
+            if found_images < expected_images:
+                raise Exception(f"Missing image files. Expected {expected_images}, found {found_images}")
         
         # Build the comparison data structure like comp.py
         fields = {
@@ -2484,108 +2787,68 @@ def _upload_single_comparison(config, frames, processed_videos, title_suffix="")
             colored_print(f"[WARN] Uploading {len(frames)} frames - this might take a while or fail due to size limits", Colors.YELLOW)
         
         # Add comparison data for each frame (like comp.py)
-        for x in range(0, len(frames)):
-            fields[f'comparisons[{x}].name'] = str(frames[x])
-            
+        # Image-name keys and values are identical for every frame, so build them once
+        image_name_fields = [(f'.imageNames[{i}]', video['name']) for i, video in enumerate(processed_videos)]
+        for x, frame_num in enumerate(frames):
+            prefix = f'comparisons[{x}]'
+            fields[prefix + '.name'] = str(frame_num)
+
             # Add image names for this frame
-            for i, video in enumerate(processed_videos):
-                fields[f'comparisons[{x}].imageNames[{i}]'] = video['name']
+            for key_suffix, name in image_name_fields:
+                fields[prefix + key_suffix] = name
         
         colored_print(f"[INFO] Found {len(frames)} frames with {len(processed_videos)} sources each", Colors.BLUE, bold=True)
         
         # Start upload process
-        with Session() as sess:
+        with _create_slowpics_session() as sess:
             # Get the initial page to establish session and get XSRF token
             colored_print("[LINK] Establishing session...", Colors.CYAN)
             
-            # Try to establish session with rate limit handling
-            session_attempts = 3
-            for session_attempt in range(session_attempts):
-                try:
-                    session_response = sess.get('https://slow.pics/comparison', timeout=30)
-                    
-                    if session_response.status_code == 200:
-                        break
-                    elif session_response.status_code == 429:
-                        if session_attempt < session_attempts - 1:
-                            wait_time = (session_attempt + 1) * 30  # 30s, 60s, 90s
-                            colored_print(f"[WARN] Rate limited. Waiting {wait_time}s before retry...", Colors.YELLOW)
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            raise Exception(f"Rate limited after {session_attempts} attempts. Status: 429")
-                    else:
-                        raise Exception(f"Failed to establish session with slow.pics. Status: {session_response.status_code}")
-                except requests.exceptions.Timeout:
-                    if session_attempt < session_attempts - 1:
-                        colored_print(f"[WARN] Session timeout (attempt {session_attempt + 1}/{session_attempts}), retrying...", Colors.YELLOW)
-                        time.sleep(5)
-                        continue
-                    else:
-                        raise Exception("Session establishment timed out after multiple attempts")
+            # Rate limits, server errors and timeouts are retried by the adapter (_SLOWPICS_RETRY)
+            try:
+                session_response = sess.get('https://slow.pics/comparison', timeout=30)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Session establishment failed after multiple attempts: {e}")
+            
+            if session_response.status_code == 429:
+                raise Exception(f"Rate limited after {_SLOWPICS_RETRY.total} retries. Status: 429")
+            elif session_response.status_code != 200:
+                raise Exception(f"Failed to establish session with slow.pics. Status: {session_response.status_code}")
             
             # Verify XSRF token is available
             if 'XSRF-TOKEN' not in sess.cookies.get_dict():
                 raise Exception("Failed to obtain XSRF token from slow.pics session")
             
-            # Create the comparison with retry logic
-            files = MultipartEncoder(fields, str(uuid.uuid4()))
-            
+            # Create the comparison, backing off on rate limits, server errors and timeouts
             colored_print("[COPY] Creating comparison...", Colors.CYAN)
             
-            max_retries = 3
-            retry_delay = 2  # seconds
+            def post_comparison():
+                # A streamed encoder is consumed by the send, so every attempt gets a fresh one
+                files = MultipartEncoder(fields, _multipart_boundary())
+                return sess.post(
+                    'https://slow.pics/upload/comparison', 
+                    data=files,
+                    headers=_get_slowpics_header(str(files.len), files.content_type, sess),
+                    timeout=60  # 60 second timeout
+                )
             
-            for attempt in range(max_retries):
-                try:
-                    comp_req = sess.post(
-                        'https://slow.pics/upload/comparison', 
-                        data=files.to_string(),
-                        headers=_get_slowpics_header(str(files.len), files.content_type, sess),
-                        timeout=60  # 60 second timeout
-                    )
-                    
-                    if comp_req.status_code == 200:
-                        break  # Success!
-                    elif comp_req.status_code == 500 and attempt < max_retries - 1:
-                        colored_print(f"[WARN] Server error (attempt {attempt + 1}/{max_retries}), retrying in {retry_delay}s...", Colors.YELLOW)
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                        continue
-                    else:
-                        # Final attempt or non-retryable error
-                        error_msg = f"Failed to create comparison. Status: {comp_req.status_code}"
-                        try:
-                            error_response = comp_req.json()
-                            if 'error' in error_response:
-                                error_msg += f", Error: {error_response['error']}"
-                            if 'message' in error_response:
-                                error_msg += f", Message: {error_response['message']}"
-                        except:
-                            error_msg += f", Response: {comp_req.text[:200]}"
-                        
-                        raise Exception(error_msg)
-                        
-                except requests.exceptions.Timeout:
-                    if attempt < max_retries - 1:
-                        colored_print(f"[WARN] Request timeout (attempt {attempt + 1}/{max_retries}), retrying in {retry_delay}s...", Colors.YELLOW)
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
-                    else:
-                        raise Exception("Request timed out after multiple attempts")
-                
-                except requests.exceptions.RequestException as e:
-                    if attempt < max_retries - 1:
-                        colored_print(f"[WARN] Network error (attempt {attempt + 1}/{max_retries}): {e}, retrying in {retry_delay}s...", Colors.YELLOW)
-                        time.sleep(retry_delay)
-                        retry_delay *= 2
-                        continue
-                    else:
-                        raise Exception(f"Network error after multiple attempts: {e}")
+            try:
+                comp_req = _send_with_backoff(post_comparison)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Network error after multiple attempts: {e}")
             
             if comp_req.status_code != 200:
-                raise Exception(f"Failed to create comparison after {max_retries} attempts")
+                error_msg = f"Failed to create comparison. Status: {comp_req.status_code}"
+                try:
+                    error_response = comp_req.json()
+                    if 'error' in error_response:
+                        error_msg += f", Error: {error_response['error']}"
+                    if 'message' in error_response:
+                        error_msg += f", Message: {error_response['message']}"
+                except:
+                    error_msg += f", Response: {comp_req.text[:200]}"
+                
+                raise Exception(error_msg)
             
             comp_response = comp_req.json()
             collection = comp_response["collectionUuid"]
@@ -2593,56 +2856,44 @@ def _upload_single_comparison(config, frames, processed_videos, title_suffix="")
             
             colored_print("[?] Comparison created, uploading images...", Colors.GREEN, bold=True)
             
-            # Upload each image frame by frame, source by source
+            # Resolve every image frame by frame, source by source
             total_images = len(frames) * len(processed_videos)
             uploaded = 0
+            upload_jobs = []
             
-            for frame_index, frame_num in enumerate(frames):
-                image_section = comp_response["images"][frame_index]
-                
-                for source_index, video in enumerate(processed_videos):
-                    source_folder = os.path.join(base_screenshots_folder, video['name'])
-                    
+            # Reuse the folder indexes from the count check, kept parallel to
+            # source_names so the loop below needs no dict lookups
+            source_indexes = [folder_indexes[name] for name in source_names]
+            
+            for frame_num, image_section in zip(frames, comp_response["images"]):
+                for name, index, image_id in zip(source_names, source_indexes, image_section):
                     # Find the specific image file for this frame and source
-                    expected_filename = f"{video['name']}_{frame_num:06d}.png"
-                    image_path = os.path.join(source_folder, expected_filename)
+                    image_path = index.get(frame_num)
+                    if image_path is None:
+                        raise FileNotFoundError(f"Could not find image for {name} frame {frame_num} "
+                                                f"(expected {name}_{frame_num:06d}.png in {source_folders[name]})")
                     
-                    if not os.path.exists(image_path):
-                        # Fallback: look for any file matching the pattern
-                        pattern_files = [f for f in os.listdir(source_folder) 
-                                       if f.startswith(f"{video['name']}_{frame_num:06d}") and f.endswith('.png')]
-                        
-                        if not pattern_files:
-                            raise Exception(f"Could not find image for {video['name']} frame {frame_num}")
+                    upload_jobs.append((image_path, image_id))
+            
+            # Upload images concurrently; the worker cap keeps the load on the server bounded
+            max_workers = max(1, min(SLOWPICS_UPLOAD_WORKERS, total_images))
+            print_progress = _upload_progress_printer(total_images)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_upload_slowpics_image, sess, collection, browserId, image_path, image_id)
+                    for image_path, image_id in upload_jobs
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
                         
-                        image_path = os.path.join(source_folder, pattern_files[0])
-                    image_id = image_section[source_index]
-                    
-                    upload_info = {
-                        "collectionUuid": collection,
-                        "imageUuid": image_id,
-                        "file": (os.path.basename(image_path), pathlib.Path(image_path).read_bytes(), 'image/png'),
-                        'browserId': browserId,
-                    }
-                    
-                    upload_info_encoded = MultipartEncoder(upload_info, str(uuid.uuid4()))
-                    upload_response = sess.post(
-                        'https://slow.pics/upload/image', 
-                        data=upload_info_encoded.to_string(),
-                        headers=_get_slowpics_header(str(upload_info_encoded.len), upload_info_encoded.content_type, sess),
-                        timeout=60
-                    )
-                    
-                    if upload_response.status_code != 200 or upload_response.content.decode() != "OK":
-                        raise Exception(f"Failed to upload image {os.path.basename(image_path)}. Status: {upload_response.status_code}")
-                    
-                    uploaded += 1
-                    progress = (uploaded / total_images) * 100
-                    colored_print(f"[REFRESH] Progress: {uploaded}/{total_images} images uploaded ({progress:.1f}%)", Colors.BLUE, end='\r')
-                    
-                    # Small delay between uploads to be respectful to the server
-                    if uploaded < total_images:  # Don't delay after the last upload
-                        time.sleep(0.1)  # 100ms delay
+                        uploaded += 1
+                        print_progress(uploaded)
+                except Exception:
+                    # Don't start any more uploads once one has failed
+                    for future in futures:
+                        future.cancel()
+                    raise
             
             colored_print(f"\n[OK] Upload complete!", Colors.GREEN, bold=True)
             
@@ -2651,8 +2902,8 @@ def _upload_single_comparison(config, frames, processed_videos, title_suffix="")
         
         # Open URL directly in browser
         try:
-            webbrowser.open(slowpics_url)
-            colored_print("[START] Opening comparison in your default browser...", Colors.GREEN, bold=True)
+            if _open_in_browser(slowpics_url):
+                colored_print("[START] Opening comparison in your default browser...", Colors.GREEN, bold=True)
         except Exception as e:
             colored_print(f"[WARN] Could not open browser: {e}", Colors.YELLOW)
         
@@ -2702,6 +2953,12 @@ def show_help():
     colored_print("python comparev2.py              # Interactive mode", Colors.WHITE)
     colored_print("python comparev2.py --help       # Show this help", Colors.WHITE)
     colored_print("python comparev2.py --demo       # Show available backends", Colors.WHITE)
+    colored_print(f"python comparev2.py --save-config [file]  # Interactive mode, saving the answers (default: {LAST_RUN_CONFIG})", Colors.WHITE)
+    colored_print(f"python comparev2.py --config {LAST_RUN_CONFIG}  # Re-run a saved configuration without prompts", Colors.WHITE)
+    
+    colored_print("\n[TIP] FASTER SCREENSHOTS:", Colors.YELLOW, bold=True)
+    colored_print("Set COMPARE_PNG_COMPRESSION=1 (0-9) to trade larger PNGs for much faster encoding.", Colors.WHITE)
+    colored_print("Useful when screenshots are only generated to be uploaded to slow.pics.", Colors.WHITE)
 
 def show_demo():
     """Show detected backends and capabilities"""
@@ -2712,7 +2969,7 @@ def show_demo():
     # Show VapourSynth status
     if VAPOURSYNTH_AVAILABLE:
         colored_print("[OK] VapourSynth: Available", Colors.GREEN, bold=True)
-        if awf:
+        if AWSMFUNC_AVAILABLE:
             colored_print("   awsmfunc: Available", Colors.GREEN)
         else:
             colored_print("   awsmfunc: Not found", Colors.YELLOW)
@@ -2737,6 +2994,12 @@ def show_demo():
     else:
         colored_print("[ERROR] NumPy: Not available", Colors.RED)
     
+    # Show optional PNG encoder status
+    if PYSPNG_AVAILABLE:
+        colored_print("[OK] pyspng: Available (fast PNG encoding)", Colors.GREEN)
+    else:
+        colored_print("   pyspng: Not found (PNGs are encoded with PIL)", Colors.YELLOW)
+    
     colored_print(f"\n[MODE] Active Processing Mode: {initialize_processing_mode().upper()}", Colors.CYAN, bold=True)
 
 def add_frame_info(clip_or_data, title):
@@ -2795,7 +3058,9 @@ def apply_frame_processing(video_data, frame_number):
     if video_data.get('overlay_enabled', False):
         title = video_data['title']
         text = f"Frame: {frame_number:06d} | Source: {title}"
-        frame = processor.add_text_overlay(frame, text)
+        # OpenCV decodes into a fresh array on every read, so nothing else holds this frame
+        # and the text can be drawn on it directly instead of on a full-frame copy
+        frame = processor.add_text_overlay(frame, text, in_place=processor.mode == "opencv")
     
     return frame
 
@@ -3005,14 +3270,14 @@ def process_and_generate_screenshots(config):
         if resize_config.get('resize_method') == 'individual':
             individual_resizes = resize_config.get('individual_resizes', {})
             if individual_resizes:
-                colored_print(f"[🔧] Individual video resizing applied using Spline36:", Colors.YELLOW, bold=True)
+                colored_print(f"[🔧] Individual video resizing applied using {RESIZE_KERNEL}:", Colors.YELLOW, bold=True)
                 for name, resolution in individual_resizes.items():
                     colored_print(f"    {name}: resized to {resolution[0]}x{resolution[1]}", Colors.CYAN)
             else:
                 colored_print(f"[📐] No individual resizing applied", Colors.WHITE)
         elif resize_config.get('resize_method') == 'common':
             common_res = resize_config.get('common_resolution')
-            colored_print(f"[🔧] All videos resized to {common_res[0]}x{common_res[1]} using Spline36", Colors.YELLOW, bold=True)
+            colored_print(f"[🔧] All videos resized to {common_res[0]}x{common_res[1]} using {RESIZE_KERNEL}", Colors.YELLOW, bold=True)
         elif resize_config.get('resize_method') == 'none':
             colored_print(f"[📐] Original resolutions maintained", Colors.WHITE)
         
@@ -3061,15 +3326,21 @@ def generate_screenshots_robust(frames, video_info_clips):
     colored_print(f"[🧹] Cleaning up existing screenshots...", Colors.YELLOW)
     for video_info in video_info_clips:
         source_folder = os.path.join(base_screenshots_folder, video_info['name'])
-        if os.path.exists(source_folder):
+        # Listing the folder doubles as the existence check, saving a stat round-trip on network drives
+        try:
+            with os.scandir(source_folder) as entries:
+                stale_files = [entry.path for entry in entries
+                               if entry.name.endswith('.png') and entry.is_file(follow_symlinks=False)]
+        except FileNotFoundError:
+            stale_files = None
+        
+        if stale_files is not None:
             # Remove all PNG files from the source folder
-            for file in os.listdir(source_folder):
-                if file.endswith('.png'):
-                    file_path = os.path.join(source_folder, file)
-                    try:
-                        os.remove(file_path)
-                    except OSError as e:
-                        colored_print(f"[WARN] Warning: Could not remove {file_path}: {e}", Colors.YELLOW)
+            for file_path in stale_files:
+                try:
+                    os.remove(file_path)
+                except OSError as e:
+                    colored_print(f"[WARN] Warning: Could not remove {file_path}: {e}", Colors.YELLOW)
             colored_print(f"  [OK] Cleaned Screenshots/{video_info['name']}/", Colors.GREEN)
         else:
             os.makedirs(source_folder, exist_ok=True)
@@ -3081,54 +3352,79 @@ def generate_screenshots_robust(frames, video_info_clips):
     error_count = 0
     
     if processor.mode == "vapoursynth":
-        # VapourSynth mode - use improved PIL-based saving instead of fpng
-        for i, frame_num in enumerate(frames):
-            progress = (i + 1) / len(frames) * 100
-            colored_print(f"[🔄] Processing frame {frame_num} ({i+1}/{len(frames)}) - {progress:.1f}%", Colors.BLUE)
-            
-            for video_info in video_info_clips:
-                try:
-                    # Create source-specific folder
-                    source_folder = os.path.join(base_screenshots_folder, video_info['name'])
-                    os.makedirs(source_folder, exist_ok=True)
-                    
-                    # Get single frame from VapourSynth clip
-                    src_frame = video_info['clip'][frame_num:frame_num+1]
+        # VapourSynth mode - use libspng/PIL-based saving instead of fpng
+        # Resolve name and filename prefix once per source rather than per frame
+        sources = [
+            (video_info['name'], os.path.join(base_screenshots_folder, video_info['name'], f"{video_info['name']}_"))
+            for video_info in video_info_clips
+        ]
+        total_frames = len(frames)
+        
+        # Convert each source to RGB24 once and keep a few frame requests in flight per source,
+        # so VapourSynth renders upcoming frames while the current ones are being encoded
+        frame_streams = [
+            processor.get_frames(processor.rgb24_clip(video_info['clip']), frames)
+            for video_info in video_info_clips
+        ]
+        
+        # PNG encodes run in a pool so several frames are compressed at once; the number of
+        # rendered frames waiting for the encoder is bounded to keep memory use flat
+        pending_saves = deque()
+        max_pending_saves = MAX_PENDING_ENCODES * max(1, len(sources))
+        
+        def finish_oldest_save():
+            nonlocal success_count, error_count
+            frame_num, name, save_future = pending_saves.popleft()
+            try:
+                save_future.result()
+                success_count += 1
+            except Exception as e:
+                colored_print(f"[ERROR] Error saving frame {frame_num} for {name}: {e}", Colors.RED)
+                error_count += 1
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as encoder:
+            for i, frame_num in enumerate(frames):
+                progress = (i + 1) / total_frames * 100
+                colored_print(f"[🔄] Processing frame {frame_num} ({i+1}/{total_frames}) - {progress:.1f}%", Colors.BLUE)
+                
+                # Format the frame suffix once and share it across sources
+                frame_suffix = f"{frame_num:06d}.png"
+                
+                for (name, file_prefix), frame_stream in zip(sources, frame_streams):
+                    try:
+                        # Collect the prefetched frame from VapourSynth
+                        _, frame_future = next(frame_stream)
+                        vs_frame = frame_future.result()
+                    except Exception as e:
+                        colored_print(f"[ERROR] Error processing frame {frame_num} for {name}: {e}", Colors.RED)
+                        error_count += 1
+                        continue
                     
                     # Save using the processor's improved save method
-                    filename = os.path.join(source_folder, f"{video_info['name']}_{frame_num:06d}.png")
-                    processor.save_frame_as_png(src_frame, filename)
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    colored_print(f"[ERROR] Error processing frame {frame_num} for {video_info['name']}: {e}", Colors.RED)
-                    error_count += 1
+                    filename = file_prefix + frame_suffix
+                    pending_saves.append((frame_num, name, encoder.submit(processor.write_rgb_frame, vs_frame, filename)))
+                    if len(pending_saves) >= max_pending_saves:
+                        finish_oldest_save()
+            
+            while pending_saves:
+                finish_oldest_save()
     
     else:
-        # Fallback mode - process frames individually  
-        for i, frame_num in enumerate(frames):
-            progress = (i + 1) / len(frames) * 100
-            colored_print(f"[🔄] Processing frame {frame_num} ({i+1}/{len(frames)}) - {progress:.1f}%", Colors.BLUE)
-            
-            for video_info in video_info_clips:
-                try:
-                    # Create source-specific folder
-                    source_folder = os.path.join(base_screenshots_folder, video_info['name'])
-                    os.makedirs(source_folder, exist_ok=True)
-                    
-                    # Process the frame
-                    processed_frame = apply_frame_processing(video_info['clip'], frame_num)
-                    
-                    # Save the frame
-                    filename = os.path.join(source_folder, f"{video_info['name']}_{frame_num:06d}.png")
-                    processor.save_frame_as_png(processed_frame, filename)
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    colored_print(f"[ERROR] Error processing frame {frame_num} for {video_info['name']}: {e}", Colors.RED)
-                    error_count += 1
+        # Fallback mode - each source has its own capture, so sources are rendered in parallel.
+        # OpenCV releases the GIL while decoding, resizing and encoding, so threads scale across cores.
+        # PNG encoding runs in a shared pool so it overlaps with decoding of the following frames.
+        colored_print(f"[🔄] Rendering {len(video_info_clips)} sources in parallel...", Colors.BLUE)
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as encoder, \
+             ThreadPoolExecutor(max_workers=max(1, len(video_info_clips))) as executor:
+            futures = [
+                executor.submit(_render_source_screenshots, video_info, frames,
+                                os.path.join(base_screenshots_folder, video_info['name']), encoder)
+                for video_info in video_info_clips
+            ]
+            for future in futures:
+                source_success, source_errors = future.result()
+                success_count += source_success
+                error_count += source_errors
     
     # Report results
     total_expected = len(frames) * len(video_info_clips)
@@ -3139,6 +3435,60 @@ def generate_screenshots_robust(frames, video_info_clips):
     
     return success_count > 0
 
+# Decoded frames a single source may have queued for PNG encoding at once
+MAX_PENDING_ENCODES = 4
+
+def _render_source_screenshots(video_info, frames, source_folder, encoder):
+    """Render every requested frame of one fallback-mode source, handing PNG encoding to the encoder pool"""
+    success_count = 0
+    error_count = 0
+    
+    # Create source-specific folder; the processor remembers it, so the per-frame saves skip makedirs
+    processor.prepare_output_dir(source_folder)
+    
+    name = video_info['name']
+    clip = video_info['clip']
+    file_prefix = os.path.join(source_folder, f"{name}_")
+    
+    # Visit frames in ascending order so the capture can decode forward instead of seeking
+    frames = sorted(frames)
+    total_frames = len(frames)
+    
+    # Frames decoded but not yet written; bounded so decoding can't run far ahead of encoding
+    pending = deque()
+    
+    def finish_oldest():
+        nonlocal success_count, error_count
+        i, frame_num, future = pending.popleft()
+        try:
+            future.result()
+            success_count += 1
+            progress = (i + 1) / total_frames * 100
+            colored_print(f"[🔄] {name}: frame {frame_num} ({i+1}/{total_frames}) - {progress:.1f}%", Colors.BLUE)
+        except Exception as e:
+            colored_print(f"[ERROR] Error saving frame {frame_num} for {name}: {e}", Colors.RED)
+            error_count += 1
+    
+    for i, frame_num in enumerate(frames):
+        try:
+            # Process the frame
+            processed_frame = apply_frame_processing(clip, frame_num)
+        except Exception as e:
+            colored_print(f"[ERROR] Error processing frame {frame_num} for {name}: {e}", Colors.RED)
+            error_count += 1
+            continue
+        
+        # Save the frame while the next one is being decoded
+        filename = f"{file_prefix}{frame_num:06d}.png"
+        pending.append((i, frame_num, encoder.submit(processor.save_frame_as_png, processed_frame, filename)))
+        if len(pending) >= MAX_PENDING_ENCODES:
+            finish_oldest()
+    
+    while pending:
+        finish_oldest()
+    
+    return success_count, error_count
+
 def get_processing_order_description(config, processed_videos):
     """Generate dynamic processing order description based on actual configuration"""
     if config.get('comparison_type') != 'source_vs_encode':
@@ -3179,13 +3529,85 @@ def get_processing_order_description(config, processed_videos):
     else:
         return "Sources, Encode (no processing)"
 
+# ===============================================================================
+# SAVED CONFIGURATIONS
+# ===============================================================================
+
+# Default file for --save-config; a saved run can be repeated with --config
+LAST_RUN_CONFIG = "last_run.json"
+
+def load_config_json(path: str) -> Dict[str, Any]:
+    """Load a comparison configuration saved by an interactive run (or written by hand)"""
+    with open(path, 'r', encoding='utf-8') as config_file:
+        config = json.load(config_file)
+    
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} does not contain a configuration object")
+    if not config.get('upload_only', False):
+        if config.get('comparison_type') not in ('multiple_sources', 'source_vs_encode'):
+            raise ValueError(f"{path}: comparison_type must be 'multiple_sources' or 'source_vs_encode'")
+        missing = [video.get('path', '') for video in config.get('videos', []) if not os.path.exists(video.get('path', ''))]
+        if missing:
+            raise FileNotFoundError(f"Video file(s) from {path} not found: {', '.join(missing)}")
+    _restore_resolution_tuples(config)
+    return config
+
+def _as_resolution(value, setting: str) -> Optional[Tuple[int, int]]:
+    """Read a saved resolution as a (width, height) tuple; accepts [w, h] or {"width": w, "height": h}"""
+    if value is None:
+        return None
+    pair = (value.get('width'), value.get('height')) if isinstance(value, dict) else value
+    if (isinstance(pair, (list, tuple)) and len(pair) == 2
+            and all(isinstance(v, int) and not isinstance(v, bool) and v > 0 for v in pair)):
+        return tuple(pair)
+    raise ValueError(f"{setting} must be [width, height] or {{\"width\": ..., \"height\": ...}}, got {value!r}")
+
+def _restore_resolution_tuples(config: Dict[str, Any]):
+    """
+    Turn the resolutions of a loaded config into (width, height) tuples.
+    
+    JSON saves them as lists (and sample_config.json writes {"width", "height"} objects), but
+    apply_processing compares them with (clip.width, clip.height) and indexes them by position,
+    so anything else would resample clips that are already the right size or fail mid-run.
+    """
+    for video in config.get('videos', []):
+        video['resize'] = _as_resolution(video.get('resize'), f"videos[{video.get('name', '?')}].resize")
+    resize_config = config.get('resize_config')
+    if isinstance(resize_config, dict):
+        resize_config['common_resolution'] = _as_resolution(resize_config.get('common_resolution'),
+                                                            "resize_config.common_resolution")
+        individual_resizes = resize_config.get('individual_resizes')
+        if isinstance(individual_resizes, dict):
+            for name, resolution in individual_resizes.items():
+                individual_resizes[name] = _as_resolution(resolution, f"resize_config.individual_resizes[{name}]")
+
+def save_config_json(config: Dict[str, Any], path: str = LAST_RUN_CONFIG):
+    """Save the configuration of an interactive run so it can be re-run without prompts"""
+    try:
+        # Serialize first and swap a finished temp file in, so a failure never truncates the previous config
+        config_text = json.dumps(config, indent=2)
+        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as config_file:
+                config_file.write(config_text)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        colored_print(f"[INFO] Configuration saved to {path} (re-run with: python comparev2.py --config {path})", Colors.BLUE)
+    except (OSError, TypeError, ValueError) as e:
+        colored_print(f"[WARN] Could not save configuration to {path}: {e}", Colors.YELLOW)
+
 # =============================================================================
 # COMMAND LINE ARGUMENT PARSING
 # ==============================================================================
 
 # Only run main execution code when script is executed directly, not when imported
 if __name__ == "__main__":
-    # Check for basic help/demo/version arguments only
+    config_path = None
+    save_config_path = None
+    
+    # Check for basic help/demo/version arguments, --config and --save-config
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
         if arg in ['--help', '-h', 'help']:
@@ -3198,76 +3620,24 @@ if __name__ == "__main__":
             colored_print("Enhanced VapourSynth Screenshot Comparison Tool v2.0", Colors.CYAN, bold=True)
             colored_print("Dynamic backend support with VapourSynth, OpenCV, and PIL fallbacks", Colors.CYAN)
             sys.exit(0)
+        elif arg in ['--config', '-c']:
+            if len(sys.argv) < 3:
+                colored_print("[ERROR] --config requires a path to a JSON configuration file", Colors.RED, bold=True)
+                sys.exit(1)
+            config_path = sys.argv[2]
+        elif arg in ['--save-config', '-s']:
+            save_config_path = sys.argv[2] if len(sys.argv) > 2 else LAST_RUN_CONFIG
 
-    # Run in interactive mode only
     try:
-        config = get_user_input()
-
-        # Check if this is upload-only mode
-        if config.get('upload_only', False):
-            print_header("UPLOAD ONLY MODE")
-            colored_print(f"Uploading existing screenshots to slow.pics...", Colors.BLUE, bold=True)
-            
-            # Use existing data from config
-            frames = config['frames']
-            processed_videos = config['processed_videos']
-            
-            colored_print(f"Found {len(frames)} frames and {len(processed_videos)} sources", Colors.GREEN)
-            
-            # Upload to slow.pics
-            comparison_url = upload_to_slowpics(config, frames, processed_videos)
-            if comparison_url:
-                colored_print(f"\n[🌐] Your comparison has been uploaded and opened in your browser!", Colors.GREEN, bold=True)
-            else:
-                colored_print(f"\n[📁] Screenshots are available locally in the Screenshots/ folder", Colors.BLUE, bold=True)
-            
-            colored_print("\n[✅] Upload complete!", Colors.GREEN, bold=True)
-            sys.exit(0)
-
-        # Normal screenshot generation mode
-        colored_print(f"\n[🎬] Starting {config.get('comparison_type', 'multiple_sources').replace('_', ' ').title()} processing...", Colors.CYAN, bold=True)
-        
-        # Process videos and generate screenshots
-        success = process_and_generate_screenshots(config)
-        
-        if success:
-            colored_print(f"\n[✅] All operations completed successfully!", Colors.GREEN, bold=True)
+        if config_path:
+            # Replay a saved configuration without any prompts
+            config = load_config_json(config_path)
+            colored_print(f"[OK] Loaded configuration from {config_path}", Colors.GREEN, bold=True)
         else:
-            colored_print(f"\n[❌] Some operations failed. Check the logs above for details.", Colors.RED, bold=True)
-            sys.exit(1)
-            
-    except KeyboardInterrupt:
-        colored_print(f"\n[⚠️] Operation cancelled by user", Colors.YELLOW, bold=True)
-        sys.exit(0)
-    except Exception as e:
-        colored_print(f"\n[❌] Unexpected error: {e}", Colors.RED, bold=True)
-        colored_print(f"[🔧] Traceback:", Colors.YELLOW)
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-# Usage:
-# Simply run: python comparev2.py
-# Follow the interactive prompts to configure your comparison
-
-if __name__ == "__main__":
-    # Check for basic help/demo/version arguments only
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
-        if arg in ['--help', '-h', 'help']:
-            show_help()
-            sys.exit(0)
-        elif arg in ['--demo', '-d', 'demo']:
-            show_demo()
-            sys.exit(0)
-        elif arg in ['--version', '-v']:
-            colored_print("Enhanced VapourSynth Screenshot Comparison Tool v2.0", Colors.CYAN, bold=True)
-            colored_print("Dynamic backend support with VapourSynth, OpenCV, and PIL fallbacks", Colors.CYAN)
-            sys.exit(0)
-
-    # Run in interactive mode only
-    try:
-        config = get_user_input()
+            # Interactive mode
+            config = get_user_input()
+            if save_config_path:
+                save_config_json(config, save_config_path)
 
         # Check if this is upload-only mode
         if config.get('upload_only', False):
@@ -559,8 +559,8 @@ class ScreenshotComparisonGUI:
         
         self.comparison_url = None
         
-        # ROLLBACK OPTION: If resize-first approach doesn't work well, there's commented rollback code 
-        # in comparev2.py that implements the original crop-first approach with aspect-ratio-aware resizing
+        # ROLLBACK OPTION: If resize-first approach doesn't work well, the original crop-first
+        # approach with aspect-ratio-aware resizing can be recovered from git history of comparev2.py
         
     def update_processing_info(self):
         """Update processing backend information"""
@@ -1069,6 +1069,10 @@ class ScreenshotComparisonGUI:
                         'name': video['name']
                     })
             
+            # Create source-specific folders once, not on every frame
+            for video_info in video_info_clips:
+                os.makedirs(os.path.join(screenshots_folder, video_info['name']), exist_ok=True)
+            
             # Generate screenshots frame by frame
             screenshot_count = 0
             
@@ -1088,9 +1092,7 @@ class ScreenshotComparisonGUI:
                         self.root.after(0, lambda: self._generation_stopped())
                         return
                     
-                    # Create source-specific folder
                     source_folder = os.path.join(screenshots_folder, video_info['name'])
-                    os.makedirs(source_folder, exist_ok=True)
                     
                     try:
                         if processor.mode == "vapoursynth":